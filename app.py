@@ -5,111 +5,208 @@ Professional Serial Communication Interface for Hardware Development
 Updated with Showport Command Parser
 """
 
+import sys
+
+# eventlet has to patch the stdlib before anything else imports socket/threading.
+# pyserial's Win32 reads are not cooperative, so Windows stays on threading mode.
+SOCKETIO_ASYNC_MODE = 'threading'
+if sys.platform != 'win32':
+    try:
+        import eventlet
+        eventlet.monkey_patch()
+        SOCKETIO_ASYNC_MODE = 'eventlet'
+    except ImportError:
+        pass
+
 import json
 import logging
+import queue
 import threading
 import time
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from decimal import Decimal
+from typing import Dict, List, Optional, Any, Tuple
 import serial
 import serial.tools.list_ports
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, render_template, jsonify, request, Response, send_file, stream_with_context
 from flask_socketio import SocketIO, emit
 import re
-from collections import deque
+import struct
+import uuid
+from collections import OrderedDict, deque, namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 import hashlib
 import os
-import sys
-from tests.link_training_time import LinkTrainingTimeMeasurement
-from tests.link_retrain_count import LinkRetrainCount
 from atlas3_parser import Atlas3Parser
 
 # Add tests directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'tests'))
 
-# Configure logging
-# Ensure logs directory exists with proper permissions
-try:
-    os.makedirs('logs', exist_ok=True)
-    # Try to create a test file to check permissions
-    test_log_path = os.path.join('logs', 'calypso_py.log')
-    with open(test_log_path, 'a') as f:
-        pass  # Just test if we can write
-    
-    logging.basicConfig(
-        level=logging.INFO,  # Changed back to INFO
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(test_log_path),
-            logging.StreamHandler()
-        ]
-    )
-except (PermissionError, OSError) as e:
-    # Fall back to console-only logging if file logging fails
-    print(f"Warning: Cannot create log file ({e}), using console logging only")
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler()
-        ]
-    )
+# Configure logging; CALYPSO_LOG selects the level (DEBUG also enables SocketIO logs)
+LOG_LEVEL = os.environ.get('CALYPSO_LOG', 'INFO').upper()
+if LOG_LEVEL not in ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'):
+    LOG_LEVEL = 'INFO'
+
+# Skip if already configured (e.g. module re-imported by a debug reloader)
+if not logging.getLogger().handlers:
+    try:
+        os.makedirs('logs', exist_ok=True)
+        log_path = os.path.join('logs', 'calypso_py.log')
+
+        # FileHandler raises if the log file cannot be opened for append
+        logging.basicConfig(
+            level=LOG_LEVEL,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            handlers=[
+                logging.FileHandler(log_path),
+                logging.StreamHandler()
+            ]
+        )
+    except (PermissionError, OSError) as e:
+        # Fall back to console-only logging if file logging fails
+        print(f"Warning: Cannot create log file ({e}), using console logging only")
+        logging.basicConfig(
+            level=LOG_LEVEL,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            handlers=[
+                logging.StreamHandler()
+            ]
+        )
 logger = logging.getLogger(__name__)
 
 try:
     from tests.test_runner import TestRunner
     from tests.pcie_discovery import PCIeDiscovery
     from tests.nvme_discovery import NVMeDiscovery
+    from tests.link_training_time import LinkTrainingTimeMeasurement
+    from tests.link_retrain_count import LinkRetrainCount
     from tests.unified_testing_engine import UnifiedTestingEngine
+    from tests.results_exporter import ResultsExporter
     TESTING_AVAILABLE = True
 except ImportError as e:
     logger.warning(f"Testing modules not available: {e}")
     TESTING_AVAILABLE = False
 
+try:
+    import orjson
+    from flask.json.provider import JSONProvider
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logger.warning("orjson not available - using Flask's default JSON encoder")
+
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
+    logger.warning("flask_compress not available - HTTP responses will be sent uncompressed")
+
 # Initialize test runner (add near other global instances)
 if TESTING_AVAILABLE:
     test_runner = TestRunner()
     logger.info("Test Runner initialized")
+    # Stateless; shared by every export route
+    results_exporter = ResultsExporter()
+
+
+# Serial port description keywords -> (device_type, icon), in priority order
+_PORT_TYPE_KEYWORDS = (
+    ('arduino', ('Arduino', '🔧')),
+    ('nano', ('Arduino', '🔧')),
+    ('uno', ('Arduino', '🔧')),
+    ('esp32', ('ESP Development Board', '📡')),
+    ('esp8266', ('ESP Development Board', '📡')),
+    ('ftdi', ('USB Serial Adapter', '🔌')),
+    ('cp210', ('USB Serial Adapter', '🔌')),
+    ('ch340', ('USB Serial Adapter', '🔌')),
+    ('usb', ('USB Serial Adapter', '🔌'))
+)
+_DEFAULT_PORT_TYPE = ('Serial Device', '⚡')
+
+# Commands that read/write live hardware state are never cached;
+# configuration queries rarely change and are kept longer
+_NO_CACHE_PREFIXES = ('mr ', 'dr ', 'dp ', 'mw ')
+_LONG_TTL_CMDS = frozenset(('showmode', 'getconfig', 'showport'))
+LONG_CACHE_TTL_SECONDS = 3600
+
+
+def _command_cache_ttl(command: str, default_ttl: float) -> float:
+    """Cache TTL for a command (0 disables caching)"""
+    cmd_lower = command.lower().strip()
+    if cmd_lower.startswith(_NO_CACHE_PREFIXES):
+        return 0
+    if cmd_lower in _LONG_TTL_CMDS:
+        return LONG_CACHE_TTL_SECONDS
+    return default_ttl
+
+# Response terminators (besides the cmd> prompt), matched against the raw
+# lower-cased bytes, and how much preceding data must be kept to catch one
+# split across two chunks
+_TERMINATORS = (b'ok\r', b'error\r', b'done\r')
+_PROMPT = b'cmd>'
+_TERMINATOR_TAIL = max(len(term) for term in _TERMINATORS + (_PROMPT,)) - 1
+
+
+@lru_cache(maxsize=256)
+def _encode_cmd(command: str) -> bytes:
+    """Encode a command with its line terminator; dashboards re-send the same few commands"""
+    return (command + '\r\n').encode('utf-8')
 
 
 class CalypsoPyCache:
-    """Simple caching system"""
+    """Simple caching system (LRU with a per-entry idle TTL)"""
 
     def __init__(self, max_size: int = 1000, ttl_seconds: int = 600):
-        self.cache = {}
-        self.access_times = {}
+        # key -> (last_access, ttl, response), least recently used first
+        self.cache = OrderedDict()
         self.max_size = max_size
         self.ttl = ttl_seconds
         self.lock = threading.RLock()
 
-    def _generate_key(self, command: str, port: str, dashboard: str = "general") -> str:
-        return hashlib.md5(f"{dashboard}:{port}:{command}".encode()).hexdigest()
+    def _generate_key(self, command: str, port: str, dashboard: str = "general") -> Tuple[str, str, str]:
+        # Keys never leave the process, so the tuple itself is the key (no digest needed)
+        return (dashboard, port, command)
 
     def get(self, command: str, port: str, dashboard: str = "general") -> Optional[Dict]:
         with self.lock:
             key = self._generate_key(command, port, dashboard)
-            if key not in self.cache:
+            entry = self.cache.get(key)
+            if entry is None:
                 return None
 
-            if time.time() - self.access_times[key] > self.ttl:
+            now = time.monotonic()
+            if now - entry[0] > entry[1]:
                 del self.cache[key]
-                del self.access_times[key]
                 return None
 
-            self.access_times[key] = time.time()
-            return self.cache[key]
+            self.cache[key] = (now, entry[1], entry[2])
+            self.cache.move_to_end(key)
+            return entry[2]
+
+    def set(self, command: str, port: str, response: Dict, dashboard: str = "general",
+            ttl_override: Optional[float] = None):
+        ttl = self.ttl if ttl_override is None else ttl_override
+        if ttl <= 0:
+            return
 
-    def set(self, command: str, port: str, response: Dict, dashboard: str = "general"):
         with self.lock:
             key = self._generate_key(command, port, dashboard)
 
-            if len(self.cache) >= self.max_size:
-                oldest_key = min(self.access_times.keys(), key=lambda k: self.access_times[k])
-                del self.cache[oldest_key]
-                del self.access_times[oldest_key]
+            self.cache[key] = (time.monotonic(), ttl, response)
+            self.cache.move_to_end(key)
+            if len(self.cache) > self.max_size:
+                self.cache.popitem(last=False)
 
-            self.cache[key] = response
-            self.access_times[key] = time.time()
+    def clear(self, dashboard: Optional[str] = None):
+        """Drop every entry, or only those cached for one dashboard"""
+        with self.lock:
+            if dashboard is None:
+                self.cache.clear()
+            else:
+                for key in [key for key in self.cache if key[0] == dashboard]:
+                    del self.cache[key]
 
     def get_stats(self) -> Dict[str, Any]:
         with self.lock:
@@ -118,6 +215,136 @@ class CalypsoPyCache:
                 'max_size': self.max_size
             }
 
+# Register dump parsing patterns (dr / dp responses)
+_DP_PORT_RE = re.compile(r'dp\s+(\d+)', re.IGNORECASE)
+# One multiline scan yields (base_address, values) for every dump line in a response
+_LINE_RE = re.compile(r'^[ \t]*([0-9a-fA-F]+):([^\r\n]+)', re.MULTILINE)
+# Tokens are upper-cased before validation, so only upper-case digits are needed
+_HEX_DIGITS = frozenset('0123456789ABCDEF')
+# Single-register read/write responses (mr / mw)
+_MR_RE = re.compile(r'0x([0-9a-fA-F]+)\s+0x([0-9a-fA-F]+)')
+_MW_RE = re.compile(r'mw\s+0x([0-9a-fA-F]+)\s+0x([0-9a-fA-F]+)', re.IGNORECASE)
+# showport golden finger line and showmode output
+_GOLDEN_RE = re.compile(r'speed\s+(\d+),\s+width\s+(\d+),\s+max_width\s*=\s*(\d+)')
+_SBR_MODE_RE = re.compile(r'SBR\s+mode:\s*(\d+)', re.IGNORECASE)
+# Offset labels by token position (covers a 1KB line; longer lines format on the fly)
+_OFFSET_LABELS = tuple(f'+0x{idx * 4:X}' for idx in range(256))
+
+
+def _scan_register_dump(response: str) -> Dict[str, list]:
+    """
+    Scan 'ADDRESS:DATA DATA ...' dump lines (dr/dp output) into column lists
+
+    Offsets follow the token position on each line, so malformed tokens
+    are skipped without shifting the addresses of the tokens after them.
+    """
+    address_col, value_col, offset_col, decimal_col = [], [], [], []
+    columns = {
+        'address': address_col,
+        'value': value_col,
+        'offset': offset_col,
+        'decimal': decimal_col
+    }
+
+    # Error/empty responses carry no ADDRESS:DATA lines; skip the scan
+    if ':' not in response:
+        return columns
+
+    # Locals for the per-line/per-token loops (avoid repeated global/attribute lookups)
+    offset_labels = _OFFSET_LABELS
+    label_count = len(offset_labels)
+    is_hex = _HEX_DIGITS.issuperset
+    fromhex = bytes.fromhex
+    unpack = struct.unpack
+
+    for base_addr, values_str in _LINE_RE.findall(response):
+        base_addr_int = int(base_addr, 16)
+        values = values_str.upper().split()
+        count = len(values)
+
+        # Fast path: a well-formed line decodes in one bytes.fromhex/struct pass
+        try:
+            raw = fromhex(values_str)
+        except ValueError:
+            raw = b''
+
+        if (len(raw) == 4 * count and count <= label_count
+                and all(len(value) == 8 for value in values)):
+            value_col.extend(values)
+            decimal_col.extend(unpack(f'>{count}I', raw))
+            address_col.extend([f'{address:08X}' for address in
+                                range(base_addr_int, base_addr_int + 4 * count, 4)])
+            offset_col.extend(offset_labels[:count])
+            continue
+
+        for idx, value in enumerate(values):
+            # int(value, 16) alone would also accept '0X12AB', '+1234567' or '1_234567'
+            if len(value) == 8 and is_hex(value):
+                offset = idx * 4
+                address_col.append(f'{base_addr_int + offset:08X}')
+                value_col.append(value)
+                offset_col.append(offset_labels[idx] if idx < label_count else f'+0x{offset:X}')
+                decimal_col.append(int(value, 16))
+
+    return columns
+
+
+def _split_port_line(line: str) -> Optional[Tuple[str, str, str, str, str]]:
+    """
+    Split a 'PortN: speed SS, width WW, max_speedMS, max_widthMW' showport line
+
+    Returns (port, speed, width, max_speed, max_width) codes, or None when the
+    line does not have that shape. The format is fixed, so str.split replaces
+    a regex match per line.
+    """
+    parts = line.split(None, 7)
+    if len(parts) < 7:
+        return None
+
+    port, speed_kw, speed, width_kw, width, max_speed, max_width = parts[:7]
+    if (speed_kw != 'speed' or width_kw != 'width' or not port.endswith(':')
+            or not speed.endswith(',') or not width.endswith(',')
+            or not max_speed.startswith('max_speed') or not max_speed.endswith(',')
+            or not max_width.startswith('max_width')):
+        return None
+
+    fields = (port[4:-1], speed[:-1], width[:-1], max_speed[9:-1], max_width[9:].rstrip(','))
+    return fields if all(field.isdigit() for field in fields) else None
+
+
+# PCIe speed/width code tables shared by the showport fallback parser
+_SPEED_MAP = {
+    '06': 'Gen6',
+    '05': 'Gen5',
+    '04': 'Gen4',
+    '03': 'Gen3',
+    '02': 'Gen2',
+    '01': 'Gen1',
+    '00': 'No Link'
+}
+
+_WIDTH_MAP = {
+    '16': 'x16',
+    '08': 'x8',
+    '04': 'x4',
+    '02': 'x2',
+    '01': 'x1',
+    '00': 'No Link'
+}
+
+# Pre-built speed/width fields for every known (speed_code, width_code) pair,
+# so parsed port entries share the same interned strings
+_PORT_PROTO = {
+    (sc, wc): {
+        'speed': _SPEED_MAP[sc],
+        'speed_code': sys.intern(sc),
+        'width': _WIDTH_MAP[wc],
+        'width_code': sys.intern(wc)
+    }
+    for sc in _SPEED_MAP for wc in _WIDTH_MAP
+}
+
+
 class HardwareResponseParser:
     """Enhanced response parser with showport support"""
 
@@ -145,7 +372,7 @@ class HardwareResponseParser:
             elif line.startswith('Golden finger:'):
                 current_section = 'golden_finger'
                 # Parse golden finger
-                match = re.search(r'speed\s+(\d+),\s+width\s+(\d+),\s+max_width\s*=\s*(\d+)', line)
+                match = _GOLDEN_RE.search(line)
                 if match:
                     speed_code = match.group(1)
                     width_code = match.group(2)
@@ -162,21 +389,22 @@ class HardwareResponseParser:
                 continue
 
             # Parse port entries
-            port_match = re.match(r'Port(\d+):\s+speed\s+(\d+),\s+width\s+(\d+),\s+max_speed(\d+),\s+max_width(\d+)',
-                                  line)
-            if port_match:
-                port_num = port_match.group(1)
-                speed_code = port_match.group(2)
-                width_code = port_match.group(3)
-                max_speed_code = port_match.group(4)
-                max_width_code = port_match.group(5)
+            port_fields = _split_port_line(line) if line.startswith('Port') else None
+            if port_fields:
+                port_num, speed_code, width_code, max_speed_code, max_width_code = map(sys.intern, port_fields)
+
+                proto = _PORT_PROTO.get((speed_code, width_code))
+                if proto is None:
+                    proto = {
+                        'speed': HardwareResponseParser._parse_speed(speed_code),
+                        'speed_code': speed_code,
+                        'width': HardwareResponseParser._parse_width(width_code),
+                        'width_code': width_code
+                    }
 
                 port_data = {
                     'port_number': port_num,
-                    'speed': HardwareResponseParser._parse_speed(speed_code),
-                    'speed_code': speed_code,
-                    'width': HardwareResponseParser._parse_width(width_code),
-                    'width_code': width_code,
+                    **proto,
                     'max_speed': HardwareResponseParser._parse_speed(max_speed_code),
                     'max_speed_code': max_speed_code,
                     'max_width': HardwareResponseParser._parse_width(max_width_code),
@@ -192,38 +420,24 @@ class HardwareResponseParser:
         return parsed_data
 
     @staticmethod
+    @lru_cache(maxsize=32)
     def _parse_speed(speed_code: str) -> str:
         """Convert speed code to generation string"""
-        speed_map = {
-            '06': 'Gen6',
-            '05': 'Gen5',
-            '04': 'Gen4',
-            '03': 'Gen3',
-            '02': 'Gen2',
-            '01': 'Gen1',
-            '00': 'No Link'
-        }
-        return speed_map.get(speed_code, f'Unknown ({speed_code})')
+        return _SPEED_MAP.get(speed_code, f'Unknown ({speed_code})')
 
     @staticmethod
+    @lru_cache(maxsize=32)
     def _parse_width(width_code: str) -> str:
         """Convert width code to lane configuration string"""
-        width_map = {
-            '16': 'x16',
-            '08': 'x8',
-            '04': 'x4',
-            '02': 'x2',
-            '01': 'x1',
-            '00': 'No Link'
-        }
-        return width_map.get(width_code, f'Unknown ({width_code})')
+        return _WIDTH_MAP.get(width_code, f'Unknown ({width_code})')
 
     @staticmethod
-    def parse_response(raw_response: str, command: str = "", dashboard: str = "general") -> Dict[str, Any]:
+    def parse_response(raw_response: str, command: str = "", dashboard: str = "general",
+                       timestamp: Optional[str] = None) -> Dict[str, Any]:
         """Main response parser with enhanced handling"""
         parsed_data = {
             'raw': raw_response.strip(),
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp or datetime.now().isoformat(),
             'command': command,
             'dashboard': dashboard,
             'parsed': {},
@@ -231,8 +445,10 @@ class HardwareResponseParser:
             'status': 'success'
         }
 
+        cmd_lower = command.lower()
+
         # Handle showport command - Now handled by Atlas3Parser, this is fallback only
-        if command.lower() == 'showport' or dashboard == 'link_status':
+        if cmd_lower == 'showport' or dashboard == 'link_status':
             logger.warning("Using fallback parser for showport command - Atlas3Parser should handle this")
             showport_data = HardwareResponseParser.parse_showport_response(raw_response)
             parsed_data['parsed'] = showport_data
@@ -241,17 +457,17 @@ class HardwareResponseParser:
 
         # Handle clock dashboard commands
         if dashboard == 'clock':
-            if 'showmode' in command.lower():
-                mode_match = re.search(r'SBR\s+mode:\s*(\d+)', raw_response, re.IGNORECASE)
+            if 'showmode' in cmd_lower:
+                mode_match = _SBR_MODE_RE.search(raw_response)
                 if mode_match:
                     mode = int(mode_match.group(1))
                     parsed_data['parsed'] = {'firmware_config': mode}
                     parsed_data['type'] = 'showmode_response'
-            elif 'clk' in command.lower():
+            elif 'clk' in cmd_lower:
                 # Parse REFCLK status per port group
                 parsed_data['parsed'] = {'refclk_status': raw_response}
                 parsed_data['type'] = 'clk_response'
-            elif 'spread' in command.lower():
+            elif 'spread' in cmd_lower:
                 # Parse SSC spread percentage
                 parsed_data['parsed'] = {'ssc_spread': raw_response}
                 parsed_data['type'] = 'spread_response'
@@ -265,10 +481,21 @@ class CalypsoPyManager:
     def __init__(self):
         self.connections: Dict[str, serial.Serial] = {}
         self.connection_lock = threading.RLock()
+        # Per-port I/O state: commands on different ports run concurrently,
+        # and a background reader thread fills each port's receive buffer
+        self.port_locks: Dict[str, threading.Lock] = {}
+        self._read_buffers: Dict[str, bytearray] = {}
+        self._buffer_locks: Dict[str, threading.Lock] = {}
+        self._read_events: Dict[str, threading.Event] = {}
+        self._reader_threads: Dict[str, threading.Thread] = {}
         self.cache = CalypsoPyCache()
-        self.command_history: Dict[str, deque] = {}
+        # Per-port history stored column-wise: one bounded deque per field
+        self.command_history: Dict[str, Dict[str, deque]] = {}
+        # Recent entries per port and dashboard, bounded to what dashboards display
+        self.dashboard_history: Dict[str, Dict[str, deque]] = {}
         self.dashboard_states: Dict[str, Dict] = {}
         self.max_history = 200
+        self.max_dashboard_history = 20
         self.atlas3_parser = Atlas3Parser()  # Initialize the professional parser
 
         # Initialize dashboard states
@@ -299,20 +526,12 @@ class CalypsoPyManager:
                     'serial_number': getattr(port, 'serial_number', 'Unknown')
                 }
 
-                # Simple device type detection
+                # Simple device type detection: first matching keyword wins
                 desc_lower = port_info['description'].lower()
-                if any(keyword in desc_lower for keyword in ['arduino', 'nano', 'uno']):
-                    port_info['device_type'] = 'Arduino'
-                    port_info['icon'] = '🔧'
-                elif any(keyword in desc_lower for keyword in ['esp32', 'esp8266']):
-                    port_info['device_type'] = 'ESP Development Board'
-                    port_info['icon'] = '📡'
-                elif any(keyword in desc_lower for keyword in ['ftdi', 'cp210', 'ch340', 'usb']):
-                    port_info['device_type'] = 'USB Serial Adapter'
-                    port_info['icon'] = '🔌'
-                else:
-                    port_info['device_type'] = 'Serial Device'
-                    port_info['icon'] = '⚡'
+                port_info['device_type'], port_info['icon'] = next(
+                    (device_type for keyword, device_type in _PORT_TYPE_KEYWORDS if keyword in desc_lower),
+                    _DEFAULT_PORT_TYPE
+                )
 
                 ports.append(port_info)
                 logger.info(f"Added port: {port.device} - {port_info['description']}")
@@ -361,12 +580,29 @@ class CalypsoPyManager:
                 )
 
                 self.connections[port] = ser
-                self.command_history[port] = deque(maxlen=self.max_history)
+                self.port_locks[port] = threading.Lock()
+                self._read_buffers[port] = bytearray()
+                self._buffer_locks[port] = threading.Lock()
+                self._read_events[port] = threading.Event()
+                reader = threading.Thread(target=self._reader, args=(port, ser),
+                                          name=f'serial-reader-{port}', daemon=True)
+                self._reader_threads[port] = reader
+                reader.start()
+                # History buffers are created on the first connect and kept across reconnects
+                if port not in self.command_history:
+                    self.command_history[port] = {
+                        'command': deque(maxlen=self.max_history),
+                        'response': deque(maxlen=self.max_history),
+                        'timestamp': deque(maxlen=self.max_history),
+                        'dashboard': deque(maxlen=self.max_history)
+                    }
+                    self.dashboard_history[port] = {}
 
                 # Give device time to send initial prompt and read it
                 time.sleep(0.5)  # Wait for device to send initial prompt
-                if ser.in_waiting:
-                    initial_response = ser.read(ser.in_waiting).decode('utf-8', errors='ignore')
+                initial_bytes = self._drain_buffer(port)
+                if initial_bytes:
+                    initial_response = initial_bytes.decode('utf-8', errors='ignore')
                     logger.info(f"Device sent initial response: {repr(initial_response)}")
                 else:
                     logger.info("No initial response from device")
@@ -391,82 +627,131 @@ class CalypsoPyManager:
                 logger.error(f"Failed to connect to {port}: {str(e)}")
                 return {'success': False, 'message': f'Connection failed: {str(e)}'}
 
+    def _reader(self, port: str, ser: serial.Serial):
+        """Background reader: move bytes from the serial port into the port's buffer"""
+        buf = self._read_buffers[port]
+        buf_lock = self._buffer_locks[port]
+        event = self._read_events[port]
+
+        while ser.is_open:
+            try:
+                data = ser.read(max(1, ser.in_waiting))
+            except Exception as e:
+                # Raised when the port is closed underneath us or the device goes away
+                if ser.is_open:
+                    logger.error(f"Serial reader error on {port}: {e}")
+                break
+
+            if data:
+                with buf_lock:
+                    buf.extend(data)
+                event.set()
+
+        logger.debug(f"Serial reader for {port} stopped")
+
+    def _drain_buffer(self, port: str) -> bytes:
+        """Take and clear everything the reader thread has buffered for a port"""
+        with self._buffer_locks[port]:
+            data = bytes(self._read_buffers[port])
+            self._read_buffers[port].clear()
+            self._read_events[port].clear()
+        return data
+
     def execute_command(self, port: str, command: str, dashboard: str = "general", use_cache: bool = True) -> Dict[
         str, Any]:
         """Execute hardware command"""
-        if use_cache:
+        cache_ttl = _command_cache_ttl(command, self.cache.ttl) if use_cache else 0
+        if cache_ttl:
             cached_response = self.cache.get(command, port, dashboard)
             if cached_response:
                 cached_response['from_cache'] = True
                 return cached_response
 
-        with self.connection_lock:
+        port_lock = self.port_locks.get(port)
+        if port_lock is None:
+            return {'success': False, 'message': f'Port {port} not connected'}
+
+        with port_lock:
             if port not in self.connections:
                 return {'success': False, 'message': f'Port {port} not connected'}
 
             try:
                 ser = self.connections[port]
                 start_time = time.time()
+                cmd_lower = command.lower().strip()
 
                 # Handle special commands (simulation for development without hardware)
-                if dashboard == 'clock' or command.lower() in ['showmode', 'clk', 'spread']:
+                if dashboard == 'clock' or cmd_lower in ('showmode', 'clk', 'spread'):
                     raw_response = self._simulate_clock_response(command)
                 else:
                     # Send all other commands (including showport) to actual hardware
-                    ser.reset_input_buffer()
                     ser.reset_output_buffer()
+                    with self._buffer_locks[port]:
+                        ser.reset_input_buffer()
+                    self._drain_buffer(port)
+                    read_event = self._read_events[port]
 
-                    command_bytes = (command + '\r\n').encode('utf-8')
-                    ser.write(command_bytes)
+                    ser.write(_encode_cmd(command))
                     ser.flush()
 
-                    response_parts = []
+                    # Raw bytes are accumulated and decoded once after the loop; terminators
+                    # are tracked incrementally by searching each chunk together with the
+                    # tail of the data before it
+                    response_buf = bytearray()
+                    tail = b''
+                    seen_prompt = False
+                    seen_terminator = False
                     last_activity = time.time()
+                    deadline = start_time + ser.timeout * 2
                     
-                    logger.info(f"Sending command '{command}' to device...")
+                    logger.info("Sending command '%s' to device...", command)
 
-                    while time.time() - start_time < ser.timeout * 2:
-                        if ser.in_waiting:
-                            chunk = ser.read(ser.in_waiting).decode('utf-8', errors='ignore')
-                            response_parts.append(chunk)
+                    while time.time() < deadline:
+                        # Block until the reader thread delivers data instead of polling
+                        if read_event.wait(timeout=min(0.1, max(0.0, deadline - time.time()))):
+                            chunk = self._drain_buffer(port)
+                            response_buf += chunk
                             last_activity = time.time()
                             
-                            # Log each chunk received for debugging
-                            logger.debug(f"Received chunk ({len(chunk)} bytes): {repr(chunk)}")
+                            # Log each chunk received for debugging (skip the repr when debug is off)
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug("Received chunk (%d bytes): %r", len(chunk), chunk)
 
-                            full_response = ''.join(response_parts)
-                            
                             # More flexible termination detection for your device
                             # Check if response seems complete based on patterns
-                            response_lower = full_response.lower()
+                            window = tail + chunk.lower()
+                            tail = window[-_TERMINATOR_TAIL:]
+                            seen_prompt = seen_prompt or _PROMPT in window
+                            seen_terminator = seen_terminator or any(term in window for term in _TERMINATORS)
                             
                             # Check for cmd> prompt anywhere in response (your device shows this at start and end)
-                            if 'cmd>' in response_lower:
+                            if seen_prompt:
                                 # If we see cmd> and have substantial content, likely complete
-                                if len(full_response.strip()) > 50:  # Ensure we have actual content
-                                    logger.info(f"Found cmd> prompt with content, response appears complete")
+                                if len(response_buf.strip()) > 50:  # Ensure we have actual content
+                                    logger.info("Found cmd> prompt with content, response appears complete")
                                     break
                             
                             # Also check other termination patterns
-                            elif any(term in response_lower for term in ['ok\r', 'error\r', 'done\r']):
-                                logger.info(f"Found standard termination pattern")
+                            elif seen_terminator:
+                                logger.info("Found standard termination pattern")
                                 break
                                 
                         else:
                             # Increased timeout since your device sends a lot of data
                             if time.time() - last_activity > 2.0:  # Increased from 0.5 to 2.0 seconds
-                                logger.debug(f"No activity for 2.0s, breaking response loop")
+                                logger.debug("No activity for 2.0s, breaking response loop")
                                 break
-                            time.sleep(0.01)
 
-                    raw_response = ''.join(response_parts).strip()
+                    raw_response = response_buf.decode('utf-8', errors='ignore').strip()
                     
                     # Enhanced logging for debugging
-                    logger.info(f"Command '{command}' completed in {(time.time() - start_time):.2f}s")
-                    logger.info(f"Response length: {len(raw_response)} characters")
+                    logger.info("Command '%s' completed in %.2fs", command, time.time() - start_time)
+                    logger.info("Response length: %d characters", len(raw_response))
                     if raw_response:
-                        logger.info(f"Response preview: {raw_response[:200]}...")
-                        logger.debug(f"Full raw response: {repr(raw_response)}")
+                        if logger.isEnabledFor(logging.INFO):
+                            logger.info("Response preview: %s...", raw_response[:200])
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Full raw response: %r", raw_response)
                     else:
                         logger.warning(f"Empty response received for command '{command}'")
 
@@ -475,14 +760,23 @@ class CalypsoPyManager:
                 if not raw_response:
                     return {'success': False, 'message': 'No response received from device'}
 
-                # Use the professional Atlas3Parser for all command parsing
-                try:
-                    parsed_data = self.atlas3_parser.parse_command_response(command, raw_response)
-                    logger.info(f"Successfully parsed command '{command}' using Atlas3Parser")
-                except Exception as e:
-                    logger.error(f"Atlas3Parser error for command '{command}': {e}")
-                    # Fallback to original parser
-                    parsed_data = HardwareResponseParser.parse_response(raw_response, command, dashboard)
+                # One timestamp per command, shared by the parser, response and history
+                timestamp = datetime.now().isoformat()
+
+                # Register commands have a dedicated parser; everything else goes
+                # through Atlas3Parser. Only one parser runs per command.
+                if dashboard == 'registers' and cmd_lower.startswith(_NO_CACHE_PREFIXES):
+                    parsed_data = self._parse_register_command(raw_response, command)
+                else:
+                    # Use the professional Atlas3Parser for all other command parsing
+                    try:
+                        parsed_data = self.atlas3_parser.parse_command_response(command, raw_response)
+                        logger.info("Successfully parsed command '%s' using Atlas3Parser", command)
+                    except Exception as e:
+                        logger.error(f"Atlas3Parser error for command '{command}': {e}")
+                        # Fallback to original parser
+                        parsed_data = HardwareResponseParser.parse_response(raw_response, command, dashboard,
+                                                                            timestamp)
 
                 response = {
                     'success': True,
@@ -490,21 +784,30 @@ class CalypsoPyManager:
                         'raw': raw_response,
                         'parsed': parsed_data,
                         'command': command,
-                        'timestamp': datetime.now().isoformat(),
+                        'timestamp': timestamp,
                         'response_time_ms': response_time,
                         'from_cache': False
                     }
                 }
 
-                # Cache the response if enabled
-                if use_cache:
-                    self.cache.set(command, port, response, dashboard)
+                # Cache the response if enabled (volatile register commands are skipped)
+                if cache_ttl:
+                    self.cache.set(command, port, response, dashboard, ttl_override=cache_ttl)
 
                 # Store in command history
-                self.command_history[port].append({
+                history = self.command_history[port]
+                history['command'].append(command)
+                history['response'].append(raw_response)
+                history['timestamp'].append(timestamp)
+                history['dashboard'].append(dashboard)
+
+                recent = self.dashboard_history[port].get(dashboard)
+                if recent is None:
+                    recent = self.dashboard_history[port][dashboard] = deque(maxlen=self.max_dashboard_history)
+                recent.append({
                     'command': command,
                     'response': raw_response,
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': timestamp,
                     'dashboard': dashboard
                 })
 
@@ -560,10 +863,18 @@ Spread Type: DOWN_SPREAD"""
                 return {'success': False, 'message': f'Port {port} not connected'}
 
             try:
-                self.connections[port].close()
-                del self.connections[port]
-                if port in self.command_history:
-                    del self.command_history[port]
+                # Wait for any in-flight command on this port to finish
+                with self.port_locks[port]:
+                    self.connections[port].close()
+                    del self.connections[port]
+
+                reader = self._reader_threads.pop(port, None)
+                if reader is not None:
+                    reader.join(timeout=1.0)
+                del self.port_locks[port]
+                del self._read_buffers[port]
+                del self._buffer_locks[port]
+                del self._read_events[port]
 
                 logger.info(f"Disconnected from {port}")
                 return {'success': True, 'message': f'Disconnected from {port}'}
@@ -574,36 +885,44 @@ Spread Type: DOWN_SPREAD"""
 
     def get_system_status(self) -> Dict[str, Any]:
         """Get system status"""
-        with self.connection_lock:
-            connected_ports = {}
-            for port, ser in self.connections.items():
-                connected_ports[port] = {
-                    'connected': ser.is_open if ser else False,
-                    'baudrate': ser.baudrate if ser else None,
-                    'timeout': ser.timeout if ser else None,
-                    'command_count': len(self.command_history.get(port, []))
-                }
+        # Snapshot the per-port dicts instead of taking connection_lock, so status
+        # polls never wait behind a connect/disconnect in progress
+        connections = list(self.connections.items())
+        history_by_port = dict(self.command_history)
+
+        connected_ports = {}
+        for port, ser in connections:
+            history = history_by_port.get(port)
+            connected_ports[port] = {
+                'connected': ser.is_open if ser else False,
+                'baudrate': ser.baudrate if ser else None,
+                'timeout': ser.timeout if ser else None,
+                'command_count': len(history['command']) if history else 0
+            }
 
-            return {
-                'connected_ports': connected_ports,
-                'dashboard_states': self.dashboard_states,
-                'cache_stats': self.cache.get_stats(),
-                'system_info': {
-                    'version': '1.0.0',
-                    'uptime': time.time(),
-                    'total_commands': sum(len(hist) for hist in self.command_history.values())
-                }
+        return {
+            'connected_ports': connected_ports,
+            'dashboard_states': self.dashboard_states,
+            'cache_stats': self.cache.get_stats(),
+            'system_info': {
+                'version': '1.0.0',
+                'uptime': time.time(),
+                'total_commands': sum(len(hist['command']) for hist in history_by_port.values())
             }
+        }
 
     def _parse_register_command(self, raw_response: str, command: str) -> Dict[str, Any]:
         """
         Parse register read/write/dump commands
         Supports: mr, mw, dr, dp
+
+        Every operation returns 'registers' column-wise: a dict mapping each
+        field (address, value, ...) to a list indexed by register position.
         """
         parsed = {
             'command_type': 'register',
             'raw': raw_response,
-            'registers': []
+            'registers': {'address': [], 'value': []}
         }
 
         cmd_lower = command.lower().strip()
@@ -639,23 +958,20 @@ Spread Type: DOWN_SPREAD"""
         }
 
         # Match pattern: address followed by value (both hex)
-        pattern = r'0x([0-9a-fA-F]+)\s+0x([0-9a-fA-F]+)'
-        match = re.search(pattern, response)
+        match = _MR_RE.search(response)
 
         if match:
             result['address'] = match.group(1).upper()
             result['value'] = match.group(2).upper()
             result['success'] = True
             result['decimal_value'] = int(match.group(2), 16)
-            result['binary_value'] = bin(int(match.group(2), 16))[2:].zfill(32)
 
-            # Add register info
-            result['registers'] = [{
-                'address': result['address'],
-                'value': result['value'],
-                'decimal': result['decimal_value'],
-                'binary': result['binary_value']
-            }]
+            # Add register info (single-entry columns, same shape as dr/dp)
+            result['registers'] = {
+                'address': [result['address']],
+                'value': [result['value']],
+                'decimal': [result['decimal_value']]
+            }
 
         return result
 
@@ -671,8 +987,7 @@ Spread Type: DOWN_SPREAD"""
         }
 
         # Match pattern: mw command with address and data
-        pattern = r'mw\s+0x([0-9a-fA-F]+)\s+0x([0-9a-fA-F]+)'
-        match = re.search(pattern, response, re.IGNORECASE)
+        match = _MW_RE.search(response)
 
         if match:
             result['address'] = match.group(1).upper()
@@ -680,11 +995,11 @@ Spread Type: DOWN_SPREAD"""
             result['success'] = True
             result['operation'] = 'write'
 
-            result['registers'] = [{
-                'address': result['address'],
-                'value': result['value'],
-                'written': True
-            }]
+            result['registers'] = {
+                'address': [result['address']],
+                'value': [result['value']],
+                'written': [True]
+            }
 
         return result
 
@@ -694,95 +1009,82 @@ Spread Type: DOWN_SPREAD"""
         Example format:
         60800000:00000000 00100000 00000000 00000000
         60800010:00000000 00000000 00000000 000001f1
-        """
-        result = {
-            'registers': [],
-            'success': False,
-            'count': 0
-        }
 
-        # Match lines with format: ADDRESS:DATA DATA DATA DATA
-        lines = response.split('\n')
-
-        for line in lines:
-            # Match pattern: base_address:value1 value2 value3 value4
-            match = re.match(r'^([0-9a-fA-F]+):(.+)', line.strip())
-            if match:
-                base_addr = match.group(1).upper()
-                values_str = match.group(2).strip()
-                values = values_str.split()
-
-                for idx, value in enumerate(values):
-                    if re.match(r'^[0-9a-fA-F]{8}$', value):
-                        offset = idx * 4
-                        full_address_int = int(base_addr, 16) + offset
-                        full_address = format(full_address_int, '08X')
-
-                        register_entry = {
-                            'address': full_address,
-                            'value': value.upper(),
-                            'offset': '+0x{:X}'.format(offset),
-                            'decimal': int(value, 16)
-                        }
-
-                        result['registers'].append(register_entry)
-                        result['count'] += 1
-
-        if result['count'] > 0:
-            result['success'] = True
+        Registers are returned column-wise: 'registers' maps each field
+        (address, value, offset, decimal) to a list indexed by position.
+        """
+        registers = _scan_register_dump(response)
+        count = len(registers['address'])
 
-        return result
+        return {
+            'registers': registers,
+            'success': count > 0,
+            'count': count
+        }
 
     def _parse_dp_response(self, response: str, command: str) -> Dict[str, Any]:
         """
         Parse 'dp' (dump port) command response
         Similar to dr but port-specific
         Example: dp 32
-        Returns port-specific register dump
+        Returns port-specific register dump, column-wise like dr
         """
+        # Parse same format as dr
+        registers = _scan_register_dump(response)
+        count = len(registers['address'])
         result = {
-            'registers': [],
-            'success': False,
-            'count': 0,
+            'registers': registers,
+            'success': count > 0,
+            'count': count,
             'port_number': None
         }
 
         # Extract port number from command
-        port_match = re.search(r'dp\s+(\d+)', command, re.IGNORECASE)
+        port_match = _DP_PORT_RE.search(command)
         if port_match:
             result['port_number'] = int(port_match.group(1))
 
-        # Parse same format as dr
-        lines = response.split('\n')
+        return result
 
-        for line in lines:
-            match = re.match(r'^([0-9a-fA-F]+):(.+)', line.strip())
-            if match:
-                base_addr = match.group(1).upper()
-                values_str = match.group(2).strip()
-                values = values_str.split()
-
-                for idx, value in enumerate(values):
-                    if re.match(r'^[0-9a-fA-F]{8}$', value):
-                        offset = idx * 4
-                        full_address_int = int(base_addr, 16) + offset
-                        full_address = format(full_address_int, '08X')
-
-                        register_entry = {
-                            'address': full_address,
-                            'value': value.upper(),
-                            'offset': '+0x{:X}'.format(offset),
-                            'decimal': int(value, 16),
-                            'port': result['port_number']
-                        }
-
-                        result['registers'].append(register_entry)
-                        result['count'] += 1
-
-        if result['count'] > 0:
-            result['success'] = True
 
-        return result
+if ORJSON_AVAILABLE:
+    def _orjson_default(obj: Any) -> Any:
+        """Fallback for types orjson does not serialize natively"""
+        if isinstance(obj, Decimal):
+            return str(obj)
+        if hasattr(obj, '__html__'):
+            return str(obj.__html__())
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    class OrjsonProvider(JSONProvider):
+        """Flask JSON provider backed by orjson, used by every jsonify() response"""
+
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+        def dumps(self, obj: Any, **kwargs: Any) -> str:
+            return orjson.dumps(obj, default=_orjson_default, option=self.option).decode('utf-8')
+
+        def loads(self, s: Any, **kwargs: Any) -> Any:
+            return orjson.loads(s)
+
+        def response(self, *args: Any, **kwargs: Any) -> Response:
+            # Hand orjson's bytes straight to the response (no str decode/re-encode)
+            obj = self._prepare_response_obj(args, kwargs)
+            return self._app.response_class(
+                orjson.dumps(obj, default=_orjson_default, option=self.option),
+                mimetype='application/json'
+            )
+
+    class OrjsonSocketIOJSON:
+        """json-module shim so Socket.IO packets are encoded with orjson too"""
+
+        @staticmethod
+        def dumps(obj: Any, **kwargs: Any) -> str:
+            return orjson.dumps(obj, default=_orjson_default, option=OrjsonProvider.option).decode('utf-8')
+
+        @staticmethod
+        def loads(s: Any, **kwargs: Any) -> Any:
+            return orjson.loads(s)
 
 
 # Flask application setup
@@ -790,12 +1092,194 @@ app = Flask(__name__)
 app.config['SECRET_KEY'] = 'calypso-py-plus-secret-key'
 app.static_folder = 'static'
 app.static_url_path = '/static'
+if ORJSON_AVAILABLE:
+    app.json = OrjsonProvider(app)
+
+# Compress larger HTTP responses (result payloads, exports); brotli where the client accepts it
+if COMPRESS_AVAILABLE:
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.config['COMPRESS_MIN_SIZE'] = 1024
+    # Buffering would defeat the NDJSON and export streams
+    app.config['COMPRESS_STREAMS'] = False
+    Compress(app)
+
+# Behind nginx/Apache, let the proxy serve cached export files (X-Sendfile/X-Accel-Redirect)
+app.config['USE_X_SENDFILE'] = os.environ.get('CALYPSO_X_SENDFILE') == '1'
+
+# Created once at import; WSGI hosts never run the __main__ block below
+os.makedirs('logs', exist_ok=True)
+
+socketio_options = {'json': OrjsonSocketIOJSON} if ORJSON_AVAILABLE else {}
+# Optional pub/sub backend (e.g. redis://localhost:6379/0) for running several workers
+SOCKETIO_MESSAGE_QUEUE = os.environ.get('CALYPSO_MESSAGE_QUEUE')
+if SOCKETIO_MESSAGE_QUEUE:
+    socketio_options['message_queue'] = SOCKETIO_MESSAGE_QUEUE
+socketio = SocketIO(app, async_mode=SOCKETIO_ASYNC_MODE, cors_allowed_origins="*",
+                    logger=LOG_LEVEL == 'DEBUG', engineio_logger=LOG_LEVEL == 'DEBUG',
+                    **socketio_options)
+logger.info(f"SocketIO async mode: {SOCKETIO_ASYNC_MODE}")
+
+# Real-time performance samples are queued and flushed to clients every 100ms;
+# if a client falls behind, the oldest samples are dropped beyond the queue size
+REALTIME_FLUSH_INTERVAL = 0.1
+REALTIME_QUEUE_SIZE = 1024
+# Random IOPS samples are all numeric and go out as packed binary batches
+RANDOM_IOPS_METRIC_FIELDS = ('elapsed_seconds', 'progress_percent', 'total_iops', 'read_iops',
+                             'write_iops', 'latency_us', 'cpu_usage')
+
+
+def _pack_metric_batch(batch: List[Dict[str, Any]], fields: Tuple[str, ...]) -> Dict[str, Any]:
+    """
+    Pack numeric samples as row-major little-endian float64 values
+
+    Socket.IO carries the bytes as a binary attachment, so each value costs
+    8 bytes on the wire and no float formatting on either side.
+    """
+    values = [float(sample.get(name) or 0.0) for sample in batch for name in fields]
+    return {'fields': fields, 'samples': struct.pack(f'<{len(values)}d', *values)}
+
+
+def _start_metric_batcher(event: str, sid: str, fields: Optional[Tuple[str, ...]] = None):
+    """
+    Coalesce real-time samples (or progress updates) for one client into batched emits
+
+    Returns (callback, stop): callback queues a sample, a background task emits
+    the accumulated samples as one list every REALTIME_FLUSH_INTERVAL, and
+    stop() ends the task after a final flush. With fields, each batch is sent
+    as a binary float64 block of those fields instead (see _pack_metric_batch).
+    """
+    samples = queue.Queue(maxsize=REALTIME_QUEUE_SIZE)
+    flush_lock = threading.Lock()
+    running = threading.Event()
+    running.set()
+
+    def callback(sample):
+        while True:
+            try:
+                samples.put_nowait(sample)
+                return
+            except queue.Full:
+                # Drop the oldest sample to make room
+                try:
+                    samples.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def flush():
+        with flush_lock:
+            batch = []
+            while True:
+                try:
+                    batch.append(samples.get_nowait())
+                except queue.Empty:
+                    break
+            if batch:
+                socketio.emit(event, _pack_metric_batch(batch, fields) if fields else batch, to=sid)
+
+    def flush_loop():
+        while running.is_set():
+            socketio.sleep(REALTIME_FLUSH_INTERVAL)
+            flush()
+
+    def stop():
+        running.clear()
+        flush()
 
-socketio = SocketIO(app, cors_allowed_origins="*", logger=True, engineio_logger=True)
+    socketio.start_background_task(flush_loop)
+    return callback, stop
 
 # Global manager instance
 calypso_manager = CalypsoPyManager()
 
+# Test suites run on a worker pool so request/WebSocket threads stay responsive;
+# REST-submitted runs are tracked by run_id until their result is collected, oldest
+# first. Finished runs nobody collects are dropped after TEST_JOB_TTL_SECONDS, or
+# sooner to make room once MAX_TEST_JOBS runs are tracked. Runs still executing are
+# never dropped; if none has finished, new submissions are refused instead.
+_test_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='test-worker')
+MAX_TEST_JOBS = 64
+TEST_JOB_TTL_SECONDS = 3600
+_test_jobs: OrderedDict = OrderedDict()  # run_id -> (submitted_at, Future)
+_test_jobs_lock = threading.Lock()
+
+
+def _submit_test_job(test_id: str, options: Dict[str, Any]) -> Optional[str]:
+    """
+    Queue a test suite run and track it by a new run_id
+
+    Returns the run_id, or None if MAX_TEST_JOBS runs are still running or
+    waiting to be collected
+    """
+    now = time.monotonic()
+    with _test_jobs_lock:
+        for stale_id in [key for key, (submitted_at, job) in _test_jobs.items()
+                         if job.done() and now - submitted_at > TEST_JOB_TTL_SECONDS]:
+            del _test_jobs[stale_id]
+
+        if len(_test_jobs) >= MAX_TEST_JOBS:
+            # Make room by dropping the oldest finished runs only
+            finished = [key for key, (_, job) in _test_jobs.items() if job.done()]
+            for finished_id in finished[:len(_test_jobs) - MAX_TEST_JOBS + 1]:
+                del _test_jobs[finished_id]
+            if len(_test_jobs) >= MAX_TEST_JOBS:
+                return None
+
+        run_id = uuid.uuid4().hex
+        _test_jobs[run_id] = (now, _test_pool.submit(test_runner.run_test_suite, test_id, options=options))
+        return run_id
+
+# Completed run-all results kept for /api/tests/export/<run_id>, least recently used first
+MAX_STORED_RUNS = 32
+_run_results: OrderedDict = OrderedDict()
+_run_results_lock = threading.Lock()
+
+
+def _store_run_result(run_result) -> Dict[str, Any]:
+    """Convert a finished TestRunResult to a dict and keep it for export"""
+    result_dict = {
+        'run_id': run_result.run_id,
+        'start_time': run_result.start_time.isoformat(),
+        'end_time': run_result.end_time.isoformat() if run_result.end_time else None,
+        'total_duration_ms': run_result.total_duration_ms,
+        'overall_status': run_result.overall_status,
+        'summary': run_result.summary,
+        'results': run_result.results
+    }
+
+    with _run_results_lock:
+        _run_results[run_result.run_id] = result_dict
+        _run_results.move_to_end(run_result.run_id)
+        if len(_run_results) > MAX_STORED_RUNS:
+            _run_results.popitem(last=False)
+
+    return result_dict
+
+# Per-device PCI topology checks are independent lspci calls, so they overlap on a small pool
+_probe_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='pci-probe')
+
+# Capability probe instances (root/sudo/nvme-cli/setpci checks run in their
+# constructors) are shared across requests and rebuilt after PROBE_TTL_SECONDS
+PROBE_TTL_SECONDS = 300
+CapabilityProbes = namedtuple('CapabilityProbes',
+                              ['pcie_discovery', 'nvme_discovery', 'link_training', 'link_retrain'])
+_capability_probes = {'created': 0.0, 'probes': None}
+_capability_probes_lock = threading.Lock()
+
+
+def _get_capability_probes() -> CapabilityProbes:
+    """Return the cached CapabilityProbes, rebuilding them once they expire"""
+    with _capability_probes_lock:
+        now = time.monotonic()
+        if _capability_probes['probes'] is None or now - _capability_probes['created'] > PROBE_TTL_SECONDS:
+            _capability_probes['probes'] = CapabilityProbes(
+                pcie_discovery=PCIeDiscovery(),
+                nvme_discovery=NVMeDiscovery(),
+                link_training=LinkTrainingTimeMeasurement(),
+                link_retrain=LinkRetrainCount()
+            )
+            _capability_probes['created'] = now
+        return _capability_probes['probes']
+
 # Initialize unified testing engine with COM manager integration
 testing_engine = None
 if TESTING_AVAILABLE:
@@ -814,7 +1298,7 @@ def index():
 def list_ports():
     try:
         ports = calypso_manager.list_ports()
-        logger.info(f"API /api/ports called, returning {len(ports)} ports")
+        logger.debug("API /api/ports called, returning %d ports", len(ports))
         return jsonify(ports)
     except Exception as e:
         logger.error(f"Error in /api/ports: {str(e)}")
@@ -846,6 +1330,13 @@ def handle_disconnect_device(data):
     port = data.get('port')
     result = calypso_manager.disconnect(port)
     emit('disconnection_result', result)
+
+    # Downstream topology may change while the device is disconnected
+    if TESTING_AVAILABLE:
+        with _capability_probes_lock:
+            probes = _capability_probes['probes']
+        if probes is not None:
+            probes.link_retrain.invalidate_topology_cache()
     socketio.emit('system_status', calypso_manager.get_system_status())
 
 
@@ -863,7 +1354,7 @@ def handle_execute_command(data):
         })
         return
 
-    logger.info(f"Executing command '{command}' on dashboard '{dashboard}'")
+    logger.info("Executing command '%s' on dashboard '%s'", command, dashboard)
 
     result = calypso_manager.execute_command(port, command, dashboard, use_cache)
     result['dashboard'] = dashboard
@@ -880,18 +1371,13 @@ def handle_get_dashboard_data(data):
         return
 
     dashboard_state = calypso_manager.dashboard_states.get(dashboard, {})
-    command_history = list(calypso_manager.command_history.get(port, []))
-
-    dashboard_history = [
-        cmd for cmd in command_history
-        if cmd.get('dashboard') == dashboard
-    ]
+    dashboard_history = list(calypso_manager.dashboard_history.get(port, {}).get(dashboard, ()))
 
     emit('dashboard_data', {
         'success': True,
         'dashboard': dashboard,
         'state': dashboard_state,
-        'history': dashboard_history[-20:],
+        'history': dashboard_history,
         'port': port
     })
 
@@ -899,8 +1385,7 @@ def handle_get_dashboard_data(data):
 @socketio.on('clear_cache')
 def handle_clear_cache(data):
     dashboard = data.get('dashboard', 'all')
-    if dashboard == 'all':
-        calypso_manager.cache = CalypsoPyCache()
+    calypso_manager.cache.clear(None if dashboard == 'all' else dashboard)
 
     emit('cache_cleared', {
         'success': True,
@@ -909,39 +1394,72 @@ def handle_clear_cache(data):
     })
 
 
+# Available-test listings are reused for AVAILABLE_TESTS_TTL_SECONDS as an already
+# serialized JSON body; the key covers the effective uid and whether NVMe discovery
+# has found devices (which gates tests)
+AVAILABLE_TESTS_TTL_SECONDS = 60
+_available_tests_cache = {'created': 0.0, 'key': None, 'body': None, 'etag': None}
+
+
 # Testing API Routes
 @app.route('/api/tests/available')
 def list_available_tests():
-    """List available test suites with system capability checks"""
+    """List available test suites with system capability checks (?refresh=1 bypasses the cache)"""
     if not TESTING_AVAILABLE:
         return jsonify({'error': 'Testing modules not available'}), 503
 
+    cache_key = (getattr(os, 'geteuid', lambda: None)(), test_runner.nvme_devices_detected)
+    now = time.monotonic()
+    refresh = request.args.get('refresh') == '1'
+    if refresh:
+        # Re-run the capability probes as well
+        with _capability_probes_lock:
+            _capability_probes['probes'] = None
+        test_runner.invalidate_capability_cache()
+    elif (_available_tests_cache['key'] == cache_key
+            and now - _available_tests_cache['created'] < AVAILABLE_TESTS_TTL_SECONDS):
+        return _conditional_json_body(_available_tests_cache['body'], _available_tests_cache['etag'])
+
     try:
         tests = test_runner.list_available_tests()
 
         # Add system capability checks
-        pcie_discovery = PCIeDiscovery()
-        nvme_discovery = NVMeDiscovery()
-        link_training = LinkTrainingTimeMeasurement()  # NEW
-        link_retrain = LinkRetrainCount()  # NEW
+        probes = _get_capability_probes()
+
+        def pcie_capabilities(test):
+            test['has_permission'] = probes.pcie_discovery.has_root or probes.pcie_discovery.has_sudo
+            test['permission_level'] = probes.pcie_discovery.permission_level
+
+        def nvme_capabilities(test):
+            test['has_permission'] = probes.nvme_discovery.has_root or probes.nvme_discovery.has_sudo
+            test['has_nvme_cli'] = probes.nvme_discovery.has_nvme_cli
+            test['permission_level'] = probes.nvme_discovery.permission_level
+
+        def link_training_capabilities(test):
+            test['has_permission'] = probes.link_training.has_root or probes.link_training.has_sudo
+            test['permission_level'] = probes.link_training.permission_level
+
+        def link_retrain_capabilities(test):
+            test['has_permission'] = probes.link_retrain.has_root or probes.link_retrain.has_sudo
+            test['has_setpci'] = probes.link_retrain.has_setpci
+            test['permission_level'] = probes.link_retrain.permission_level
+
+        capability_handlers = {
+            'pcie_discovery': pcie_capabilities,
+            'nvme_discovery': nvme_capabilities,
+            'link_training_time': link_training_capabilities,
+            'link_retrain_count': link_retrain_capabilities
+        }
 
         for test in tests:
-            if test['id'] == 'pcie_discovery':
-                test['has_permission'] = pcie_discovery.has_root or pcie_discovery.has_sudo
-                test['permission_level'] = pcie_discovery.permission_level
-            elif test['id'] == 'nvme_discovery':
-                test['has_permission'] = nvme_discovery.has_root or nvme_discovery.has_sudo
-                test['has_nvme_cli'] = nvme_discovery.has_nvme_cli
-                test['permission_level'] = nvme_discovery.permission_level
-            elif test['id'] == 'link_training_time':  # NEW
-                test['has_permission'] = link_training.has_root or link_training.has_sudo
-                test['permission_level'] = link_training.permission_level
-            elif test['id'] == 'link_retrain_count':  # NEW
-                test['has_permission'] = link_retrain.has_root or link_retrain.has_sudo
-                test['has_setpci'] = link_retrain.has_setpci
-                test['permission_level'] = link_retrain.permission_level
-
-        return jsonify(tests)
+            handler = capability_handlers.get(test['id'])
+            if handler:
+                handler(test)
+
+        body = jsonify(tests).get_data()
+        etag = _body_etag(body)
+        _available_tests_cache.update(created=now, key=cache_key, body=body, etag=etag)
+        return _conditional_json_body(body, etag)
     except Exception as e:
         logger.error(f"Error listing tests: {e}")
         return jsonify({'error': str(e)}), 500
@@ -954,8 +1472,8 @@ def run_single_test():
         return jsonify({'error': 'Testing modules not available'}), 503
 
     try:
-        # Get JSON data from request
-        data = request.get_json()
+        # Get JSON data from request (a missing or malformed body counts as empty)
+        data = request.get_json(silent=True) or {}
 
         # Extract parameters
         test_id = data.get('test_id')
@@ -965,63 +1483,118 @@ def run_single_test():
         if not test_id:
             return jsonify({'error': 'test_id required'}), 400
 
-        logger.info(f"Running test: {test_id} (port: {port})")
+        logger.info("Running test: %s (port: %s)", test_id, port)
         if options:
-            logger.info(f"Test options: {options}")
+            logger.info("Test options: %s", options)
 
-        # Run test with options passed through
-        result = test_runner.run_test_suite(test_id, options=options)
+        # Queue test with options passed through; poll /api/tests/status/<run_id>
+        run_id = _submit_test_job(test_id, options)
+        if run_id is None:
+            return jsonify({'error': 'Too many test runs in progress; collect finished results and retry'}), 503
 
-        return jsonify(result)
+        return jsonify({'run_id': run_id, 'status': 'running'}), 202
 
     except Exception as e:
         logger.error(f"Error running test: {e}")
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/tests/status/<run_id>')
+def get_test_status(run_id):
+    """
+    Report a queued test run
+
+    Once the run is complete its result is returned and released in the same
+    response: the result can be read only once, and later polls for the
+    run_id get 404.
+    """
+    with _test_jobs_lock:
+        entry = _test_jobs.get(run_id)
+        if entry is None:
+            return jsonify({'error': f'Unknown run_id: {run_id}'}), 404
+
+        job = entry[1]
+        if not job.done():
+            return jsonify({'run_id': run_id, 'status': 'running'})
+
+        # Only one poller collects a finished run; later polls see 404
+        _test_jobs.pop(run_id, None)
+
+    try:
+        result = job.result()
+    except Exception as e:
+        logger.error(f"Error running test: {e}")
+        return jsonify({'error': str(e)}), 500
+
+    return jsonify({'run_id': run_id, 'status': 'complete', 'result': result})
+
+
 @app.route('/api/tests/run_all', methods=['POST'])
 def run_all_tests():
-    """Run all available test suites"""
+    """
+    Run all available test suites
+
+    Streams line-delimited JSON as suites finish: a 'start' line, one
+    'result' line per suite, then a 'summary' line (or an 'error' line).
+    """
     if not TESTING_AVAILABLE:
         return jsonify({'error': 'Testing modules not available'}), 503
 
-    try:
-        data = request.get_json()
-        port = data.get('port')
+    data = request.get_json(silent=True) or {}
+    port = data.get('port')
+    logger.info("Running all tests (port: %s)", port)
 
-        logger.info(f"Running all tests (port: {port})")
+    def ndjson_line(payload: Dict[str, Any]) -> str:
+        return app.json.dumps(payload) + '\n'
 
-        # Run all tests
-        run_result = test_runner.run_all_tests()
+    def generate():
+        try:
+            run_result = test_runner.begin_run()
+            yield ndjson_line({
+                'type': 'start',
+                'run_id': run_result.run_id,
+                'start_time': run_result.start_time.isoformat()
+            })
 
-        # Convert dataclass to dict for JSON serialization
-        result_dict = {
-            'run_id': run_result.run_id,
-            'start_time': run_result.start_time.isoformat(),
-            'end_time': run_result.end_time.isoformat() if run_result.end_time else None,
-            'total_duration_ms': run_result.total_duration_ms,
-            'overall_status': run_result.overall_status,
-            'summary': run_result.summary,
-            'results': run_result.results
-        }
+            for suite_id, result in test_runner.iter_all_tests(run_result):
+                yield ndjson_line({'type': 'result', 'suite_id': suite_id, 'result': result})
+
+            test_runner.finish_run(run_result)
+            _store_run_result(run_result)
+            yield ndjson_line({
+                'type': 'summary',
+                'end_time': run_result.end_time.isoformat() if run_result.end_time else None,
+                'total_duration_ms': run_result.total_duration_ms,
+                'overall_status': run_result.overall_status,
+                'summary': run_result.summary
+            })
 
-        return jsonify(result_dict)
+        except Exception as e:
+            logger.error(f"Error running all tests: {e}")
+            yield ndjson_line({'type': 'error', 'error': str(e)})
 
-    except Exception as e:
-        logger.error(f"Error running all tests: {e}")
-        return jsonify({'error': str(e)}), 500
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
 
 
 @app.route('/api/tests/export/<run_id>')
 def export_test_results(run_id):
-    """Export test results as downloadable report"""
+    """Export a recent run-all result as a downloadable JSON report"""
     if not TESTING_AVAILABLE:
         return jsonify({'error': 'Testing modules not available'}), 503
 
     try:
-        # This would retrieve from a results cache/database
-        # For now, return error as we don't persist results
-        return jsonify({'error': 'Result export not yet implemented'}), 501
+        with _run_results_lock:
+            result_dict = _run_results.get(run_id)
+            if result_dict is not None:
+                _run_results.move_to_end(run_id)
+
+        if result_dict is None:
+            return jsonify({'error': f'No stored results for run {run_id}'}), 404
+
+        response = jsonify(result_dict)
+        safe_run_id = _UNSAFE_FILENAME_RE.sub('_', run_id)
+        response.headers['Content-Disposition'] = f'attachment; filename="test_run_{safe_run_id}.json"'
+        return response
 
     except Exception as e:
         logger.error(f"Error exporting results: {e}")
@@ -1043,20 +1616,27 @@ def handle_run_test(data):
         emit('test_error', {'message': 'test_id required'})
         return
 
-    logger.info(f"WebSocket: Running test {test_id}")
+    logger.info("WebSocket: Running test %s", test_id)
 
-    # Progress callback
-    def progress_callback(update):
-        emit('test_progress', update)
+    # Run in the background; events go to the requesting client by sid
+    socketio.start_background_task(_run_test_and_emit, request.sid, test_id)
+
+
+def _run_test_and_emit(sid, test_id):
+    """Background task for handle_run_test"""
+    # Progress updates are coalesced and emitted as lists on 'test_progress_batch'
+    progress_callback, stop_progress = _start_metric_batcher('test_progress_batch', sid)
 
     try:
         # Run test with progress updates
         result = test_runner.run_test_suite(test_id, progress_callback=progress_callback)
-        emit('test_complete', result)
+        stop_progress()
+        socketio.emit('test_complete', result, to=sid)
 
     except Exception as e:
+        stop_progress()
         logger.error(f"WebSocket test error: {e}")
-        emit('test_error', {'message': str(e)})
+        socketio.emit('test_error', {'message': str(e)}, to=sid)
 
 
 @socketio.on('run_test_engine')
@@ -1073,7 +1653,7 @@ def handle_run_test_engine(data):
         emit('test_error', {'message': 'test_id required'})
         return
 
-    logger.info(f"WebSocket: Running test {test_id} with testing engine")
+    logger.info("WebSocket: Running test %s with testing engine", test_id)
 
     try:
         # Start test execution with unified testing engine
@@ -1088,7 +1668,7 @@ def handle_run_test_engine(data):
             'message': f'Test {test_id} started with unified testing engine'
         })
 
-        logger.info(f"Test {test_id} started successfully with unified testing engine")
+        logger.info("Test %s started successfully with unified testing engine", test_id)
 
     except Exception as e:
         logger.error(f"WebSocket testing engine error: {e}")
@@ -1102,33 +1682,31 @@ def handle_run_all_tests(data):
         emit('test_error', {'message': 'Testing modules not available'})
         return
 
-    port = data.get('port')
-    logger.info(f"WebSocket: Running all tests")
+    logger.info("WebSocket: Running all tests")
 
-    # Progress callback
-    def progress_callback(update):
-        emit('test_progress', update)
+    # Run in the background; events go to the requesting client by sid
+    socketio.start_background_task(_run_all_tests_and_emit, request.sid)
+
+
+def _run_all_tests_and_emit(sid):
+    """Background task for handle_run_all_tests"""
+    # Progress updates are coalesced and emitted as lists on 'test_progress_batch'
+    progress_callback, stop_progress = _start_metric_batcher('test_progress_batch', sid)
 
     try:
         # Run all tests with progress updates
         run_result = test_runner.run_all_tests(progress_callback=progress_callback)
+        stop_progress()
 
-        # Convert to dict
-        result_dict = {
-            'run_id': run_result.run_id,
-            'start_time': run_result.start_time.isoformat(),
-            'end_time': run_result.end_time.isoformat() if run_result.end_time else None,
-            'total_duration_ms': run_result.total_duration_ms,
-            'overall_status': run_result.overall_status,
-            'summary': run_result.summary,
-            'results': run_result.results
-        }
+        # Convert to dict (and keep it for export)
+        result_dict = _store_run_result(run_result)
 
-        emit('all_tests_complete', result_dict)
+        socketio.emit('all_tests_complete', result_dict, to=sid)
 
     except Exception as e:
+        stop_progress()
         logger.error(f"WebSocket all tests error: {e}")
-        emit('test_error', {'message': str(e)})
+        socketio.emit('test_error', {'message': str(e)}, to=sid)
 
 
 @app.route('/api/tests/link_training/devices')
@@ -1138,13 +1716,11 @@ def get_link_training_devices():
         return jsonify({'error': 'Testing modules not available'}), 503
 
     try:
-        from tests.link_training_time import LinkTrainingTimeMeasurement
-
         measurement = LinkTrainingTimeMeasurement()
         devices = measurement.get_available_devices()
 
-        logger.info(f"Retrieved {len(devices)} devices for link training")
-        return jsonify(devices)
+        logger.info("Retrieved %d devices for link training", len(devices))
+        return _etag_json(devices)
 
     except Exception as e:
         logger.error(f"Error getting link training devices: {e}")
@@ -1158,69 +1734,72 @@ def get_link_retrain_devices():
         return jsonify({'error': 'Testing modules not available'}), 503
 
     try:
-        # Initialize link retrain test to get filtering capability
-        link_retrain = LinkRetrainCount()
+        # Check the cheap precondition first: without discovered NVMe controllers
+        # there is nothing to classify, so skip the PCI probing entirely
+        controllers = []
+        if test_runner.nvme_devices_detected and test_runner.discovered_nvme_devices:
+            controllers = [c for c in test_runner.discovered_nvme_devices if c.get('pci_address')]
+
+        if not controllers:
+            return jsonify({
+                'available_devices': [],
+                'excluded_devices': [],
+                'error': 'No devices detected. Run PCIe Discovery or NVMe Discovery first.'
+            }), 400
 
-        # Identify Atlas 3 buses
-        link_retrain.atlas3_buses = link_retrain._identify_atlas3_buses()
+        # Shared link retrain probe keeps its per-device topology cache across requests
+        link_retrain = _get_capability_probes().link_retrain
 
-        if not link_retrain.atlas3_buses:
+        # Identify Atlas 3 buses (a recent scan is reused between listings)
+        if not link_retrain.update_atlas3_buses(max_age=link_retrain.ATLAS3_BUS_TTL_SECONDS):
             return jsonify({
                 'available_devices': [],
                 'excluded_devices': [],
                 'error': 'No Atlas 3 buses identified'
             }), 400
 
-        # Get discovered devices from test runner
+        # Snapshot before classifying; a disconnect may rescan the buses meanwhile
+        atlas3_buses = link_retrain.sorted_atlas3_buses
         all_devices = []
         excluded_devices = []
 
-        if test_runner.nvme_devices_detected and test_runner.discovered_nvme_devices:
-            # Use NVMe discovered devices
-            for controller in test_runner.discovered_nvme_devices:
-                if controller.get('pci_address'):
-                    device_info = {
-                        'device': controller.get('device', 'Unknown'),
-                        'pci_address': controller['pci_address'],
-                        'name': controller.get('model', 'Unknown'),
-                        'model': controller.get('model', 'Unknown')
-                    }
+        def classify(controller):
+            """Return (pci_address, name, exclusion reason or None) for one NVMe controller"""
+            pci_address = controller['pci_address']
+            name = controller.get('model', 'Unknown')
 
-                    # Check if downstream of Atlas 3
-                    if not link_retrain._is_device_atlas3_downstream(device_info['pci_address']):
-                        excluded_devices.append({
-                            'pci_address': device_info['pci_address'],
-                            'name': device_info['name'],
-                            'reason': 'Not downstream of Atlas 3 switch'
-                        })
-                        continue
-
-                    # Check if it's an endpoint (not a bridge)
-                    if not link_retrain._is_endpoint_device(device_info['pci_address']):
-                        excluded_devices.append({
-                            'pci_address': device_info['pci_address'],
-                            'name': device_info['name'],
-                            'reason': 'Device is a bridge/switch, not an endpoint'
-                        })
-                        continue
-
-                    # Device is valid
-                    device_info['available'] = True
-                    all_devices.append(device_info)
-
-        if not all_devices and not excluded_devices:
-            return jsonify({
-                'available_devices': [],
-                'excluded_devices': [],
-                'error': 'No devices detected. Run PCIe Discovery or NVMe Discovery first.'
-            }), 400
+            # Check if downstream of Atlas 3
+            if not link_retrain._is_device_atlas3_downstream(pci_address):
+                return pci_address, name, 'Not downstream of Atlas 3 switch'
 
-        logger.info(f"Link Retrain Devices: {len(all_devices)} available, {len(excluded_devices)} excluded")
+            # Check if it's an endpoint (not a bridge)
+            if not link_retrain._is_endpoint_device(pci_address):
+                return pci_address, name, 'Device is a bridge/switch, not an endpoint'
 
-        return jsonify({
+            return pci_address, name, None
+
+        # Classify the NVMe discovered devices; map() keeps the discovery order
+        classified = _probe_pool.map(classify, controllers)
+        for controller, (pci_address, name, reason) in zip(controllers, classified):
+            if reason:
+                excluded_devices.append({'pci_address': pci_address, 'name': name, 'reason': reason})
+                continue
+
+            # Device is valid
+            all_devices.append({
+                'device': controller.get('device', 'Unknown'),
+                'pci_address': pci_address,
+                'name': name,
+                'model': name,
+                'available': True
+            })
+
+        logger.info("Link Retrain Devices: %d available, %d excluded", len(all_devices), len(excluded_devices))
+
+        return _etag_json({
             'available_devices': all_devices,
             'excluded_devices': excluded_devices,
-            'atlas3_buses': list(link_retrain.atlas3_buses)
+            'atlas3_buses': atlas3_buses
         })
 
     except Exception as e:
@@ -1228,6 +1807,83 @@ def get_link_retrain_devices():
         return jsonify({'error': str(e)}), 500
 
 
+# Performance test request schemas: (field, type, default); _REQUIRED marks mandatory fields
+_REQUIRED = object()
+
+SEQUENTIAL_READ_REQUEST = (
+    ('device', str, _REQUIRED),
+    ('runtime_seconds', int, 60),
+    ('block_size', str, '128k'),
+    ('queue_depth', int, 32),
+)
+
+SEQUENTIAL_WRITE_REQUEST = (
+    ('device', str, '/dev/nvme0n1'),
+    ('runtime_seconds', int, 60),
+    ('block_size', str, '128k'),
+    ('queue_depth', int, 32),
+)
+
+RANDOM_IOPS_REQUEST = (
+    ('device', str, '/dev/nvme0n1'),
+    ('runtime_seconds', int, 60),
+    ('block_size', str, '4k'),
+    ('queue_depth', int, 64),
+    ('workload_type', str, 'randread'),
+    ('read_write_ratio', str, '100:0'),
+)
+
+EXPORT_REQUEST = (
+    ('results', dict, _REQUIRED),
+    ('format', str, 'csv'),
+)
+
+
+def _parse_request_options(data: Any, schema: Tuple) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Validate a decoded JSON body against a request schema in a single pass
+
+    Returns (options, None) on success or (None, error message) for a missing
+    or empty required field or a value of the wrong type
+    """
+    if not isinstance(data, dict):
+        return None, 'Request body must be a JSON object'
+
+    options = {}
+    for name, field_type, default in schema:
+        value = data.get(name, default)
+        # An empty device path or results object is as good as absent
+        if value is _REQUIRED or (default is _REQUIRED and not value):
+            return None, f'{name} required'
+        # bool is a subclass of int but never a valid count or duration
+        if not isinstance(value, field_type) or (field_type is int and isinstance(value, bool)):
+            return None, f'{name} must be of type {field_type.__name__}'
+        options[name] = value
+    return options, None
+
+
+def _body_etag(body: bytes) -> str:
+    """Content-hash ETag for a serialized response body"""
+    return hashlib.blake2b(body, digest_size=8).hexdigest()
+
+
+def _conditional_json_body(body: bytes, etag: str) -> Response:
+    """Serve an already serialized JSON body, or an empty 304 if the client has it"""
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+
+def _etag_json(payload: Any) -> Response:
+    """
+    jsonify() a payload with a content-hash ETag
+
+    Pollers that send a matching If-None-Match get an empty 304 instead of the body.
+    """
+    body = jsonify(payload).get_data()
+    return _conditional_json_body(body, _body_etag(body))
+
+
 @app.route('/api/tests/sequential_read/devices')
 def get_sequential_read_devices():
     """Get list of available NVMe devices for sequential read performance test"""
@@ -1272,7 +1928,7 @@ def get_sequential_read_devices():
 
         logger.info(f"Sequential Read Performance: {len(available_devices)} devices available")
 
-        return jsonify({
+        return _etag_json({
             'available_devices': available_devices,
             'fio_info': fio_utils.check_fio_availability(),
             'default_runtime': 60,
@@ -1291,26 +1947,13 @@ def run_sequential_read_test():
         return jsonify({'error': 'Testing modules not available'}), 503
 
     try:
-        data = request.get_json()
-        
-        device = data.get('device')
-        runtime_seconds = data.get('runtime_seconds', 60)
-        block_size = data.get('block_size', '128k')
-        queue_depth = data.get('queue_depth', 32)
-        
-        if not device:
-            return jsonify({'error': 'device required'}), 400
+        options, error = _parse_request_options(request.get_json(silent=True), SEQUENTIAL_READ_REQUEST)
+        if error:
+            return jsonify({'error': error}), 400
         
-        logger.info(f"Running sequential read performance test on {device} for {runtime_seconds}s")
+        logger.info(f"Running sequential read performance test on {options['device']} for {options['runtime_seconds']}s")
         
-        # Prepare test options
-        options = {
-            'device': device,
-            'runtime_seconds': runtime_seconds,
-            'block_size': block_size,
-            'queue_depth': queue_depth,
-            'discovered_devices': test_runner.discovered_nvme_devices
-        }
+        options['discovered_devices'] = test_runner.discovered_nvme_devices
         
         # Run test
         result = test_runner.run_test_suite('sequential_read_performance', options=options)
@@ -1341,13 +1984,19 @@ def handle_start_sequential_read_test(data):
 
     logger.info(f"WebSocket: Running sequential read test on {device}")
 
+    # Run in the background; events go to the requesting client by sid
+    socketio.start_background_task(_run_sequential_read_test, request.sid, device,
+                                   runtime_seconds, block_size, queue_depth)
+
+
+def _run_sequential_read_test(sid, device, runtime_seconds, block_size, queue_depth):
+    """Background task for handle_start_sequential_read_test"""
     # Progress callback for test progress
     def progress_callback(update):
-        emit('performance_test_progress', update)
+        socketio.emit('performance_test_progress', update, to=sid)
 
-    # Real-time callback for performance metrics
-    def real_time_callback(update):
-        emit('performance_test_realtime', update)
+    # Real-time metrics are coalesced and emitted in batches rather than per sample
+    real_time_callback, stop_realtime = _start_metric_batcher('performance_test_realtime_batch', sid)
 
     try:
         from tests.sequential_read_performance import SequentialReadPerformanceTest
@@ -1364,6 +2013,7 @@ def handle_start_sequential_read_test(data):
             progress_callback=progress_callback,
             real_time_callback=real_time_callback
         )
+        stop_realtime()
         
         # Convert result to dict format
         result_dict = {
@@ -1396,11 +2046,12 @@ def handle_start_sequential_read_test(data):
             'errors': result.errors
         }
         
-        emit('performance_test_complete', result_dict)
+        socketio.emit('performance_test_complete', result_dict, to=sid)
 
     except Exception as e:
+        stop_realtime()
         logger.error(f"WebSocket sequential read test error: {e}")
-        emit('performance_test_error', {'message': str(e)})
+        socketio.emit('performance_test_error', {'message': str(e)}, to=sid)
 
 
 @socketio.on('stop_sequential_read_test')
@@ -1417,6 +2068,108 @@ def handle_stop_sequential_read_test(data):
         emit('performance_test_error', {'message': f'Error stopping test: {str(e)}'})
 
 
+# Rendered exports are cached on disk, keyed by a hash of the results and format;
+# only the MAX_EXPORT_CACHE_FILES most recently used artifacts are kept
+EXPORT_CACHE_DIR = os.path.join('logs', 'cache')
+os.makedirs(EXPORT_CACHE_DIR, exist_ok=True)
+MAX_EXPORT_CACHE_FILES = 64
+
+# Anything outside this set is replaced when building export filenames
+_UNSAFE_FILENAME_RE = re.compile(r'[^A-Za-z0-9._-]')
+
+
+@lru_cache(maxsize=1)
+def _format_export_timestamp(epoch_second: int) -> str:
+    return datetime.fromtimestamp(epoch_second).strftime('%Y%m%d_%H%M%S')
+
+
+def _export_timestamp() -> str:
+    """Filename timestamp; formatted at most once per wall-clock second"""
+    return _format_export_timestamp(int(time.time()))
+
+
+def _cached_export(results: Dict[str, Any], export_format: str) -> Optional[str]:
+    """
+    Export results via ResultsExporter, reusing an earlier export of identical results
+
+    Returns the artifact path, or None if the export failed
+    """
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(results, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(results, sort_keys=True, default=str).encode('utf-8')
+    key = hashlib.blake2b(payload + export_format.encode('utf-8'), digest_size=16).hexdigest()
+    cache_path = os.path.join(EXPORT_CACHE_DIR, f'{key}.{export_format}')
+
+    if os.path.exists(cache_path):
+        logger.debug("Export cache hit: %s", cache_path)
+        try:
+            os.utime(cache_path)  # Mark as recently used for eviction
+        except OSError:
+            pass
+        return cache_path
+
+    # Render to a unique temp name so concurrent exports never serve a partial file
+    temp_path = os.path.join(EXPORT_CACHE_DIR, f'{key}.{uuid.uuid4().hex}.{export_format}')
+    try:
+        if not results_exporter.export_results(results, export_format, temp_path):
+            return None
+        os.replace(temp_path, cache_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    _prune_export_cache()
+    return cache_path
+
+
+def _prune_export_cache():
+    """Delete the least recently used cached exports beyond MAX_EXPORT_CACHE_FILES"""
+    entries = []
+    try:
+        with os.scandir(EXPORT_CACHE_DIR) as it:
+            for entry in it:
+                # <key>.<format> only; <key>.<uuid>.<format> renders are still in progress
+                if entry.is_file() and entry.name.count('.') == 1:
+                    entries.append((entry.stat().st_mtime, entry.path))
+    except OSError as e:
+        logger.warning(f"Could not scan export cache: {e}")
+        return
+
+    if len(entries) <= MAX_EXPORT_CACHE_FILES:
+        return
+    entries.sort()
+    for _, path in entries[:-MAX_EXPORT_CACHE_FILES]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass  # Already removed by a concurrent prune
+
+
+EXPORT_MIMETYPES = {'csv': 'text/csv', 'html': 'text/html', 'pdf': 'application/pdf'}
+
+
+def _stream_export(results: Dict[str, Any], export_format: str, filename: str) -> Response:
+    """
+    Stream an export to the client as an attachment without touching disk
+
+    The first chunk is rendered before the response starts so render failures
+    still surface as an error status rather than a truncated download.
+    """
+    chunks = results_exporter.iter_rows(results, export_format)
+    first_chunk = next(chunks, b'')
+
+    def generate():
+        yield first_chunk
+        yield from chunks
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype=EXPORT_MIMETYPES[export_format],
+        headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+    )
+
+
 @app.route('/api/tests/sequential_read/export', methods=['POST'])
 def export_sequential_read_results():
     """Export sequential read test results to various formats"""
@@ -1424,41 +2177,36 @@ def export_sequential_read_results():
         return jsonify({'error': 'Testing modules not available'}), 503
 
     try:
-        data = request.get_json()
+        options, error = _parse_request_options(request.get_json(silent=True), EXPORT_REQUEST)
+        if error:
+            return jsonify({'error': error}), 400
         
-        results = data.get('results')
-        export_format = data.get('format', 'csv').lower()
+        results = options['results']
+        export_format = options['format'].lower()
         
         if not results:
             return jsonify({'error': 'results data required'}), 400
         
-        if export_format not in ['csv', 'html', 'pdf']:
+        if export_format not in EXPORT_MIMETYPES:
             return jsonify({'error': 'format must be csv, html, or pdf'}), 400
         
-        # Import and use results exporter
-        from tests.results_exporter import ResultsExporter
-        exporter = ResultsExporter()
-        
         # Generate filename
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        device_name = results.get('device', 'unknown').replace('/', '_').replace('\\', '_')
+        timestamp = _export_timestamp()
+        device_name = _UNSAFE_FILENAME_RE.sub('_', str(results.get('device', 'unknown')))
         filename = f"sequential_read_{device_name}_{timestamp}.{export_format}"
-        output_path = os.path.join('logs', filename)
-        
-        # Ensure logs directory exists
-        os.makedirs('logs', exist_ok=True)
         
-        # Export results
-        success = exporter.export_results(results, export_format, output_path)
+        # Export results (served from the export cache when already rendered)
+        output_path = _cached_export(results, export_format)
         
-        if success:
-            # Return file for download
-            from flask import send_file
+        if output_path:
+            # Return file for download; conditional enables Range/304 and the
+            # server's sendfile path (or X-Sendfile when enabled below)
             return send_file(
                 output_path,
                 as_attachment=True,
                 download_name=filename,
-                mimetype=f'application/{export_format}' if export_format == 'pdf' else f'text/{export_format}'
+                mimetype=EXPORT_MIMETYPES[export_format],
+                conditional=True
             )
         else:
             return jsonify({'error': 'Export failed'}), 500
@@ -1471,10 +2219,10 @@ def export_sequential_read_results():
 @app.route('/api/tests/sequential_read/export_formats')
 def get_export_formats():
     """Get available export formats and their capabilities"""
+    if not TESTING_AVAILABLE:
+        return jsonify({'error': 'Testing modules not available'}), 503
+
     try:
-        from tests.results_exporter import ResultsExporter
-        exporter = ResultsExporter()
-        
         formats = {
             'csv': {
                 'name': 'CSV (Comma Separated Values)',
@@ -1491,16 +2239,16 @@ def get_export_formats():
             'pdf': {
                 'name': 'PDF Report',
                 'description': 'Professional PDF report with charts and compliance analysis',
-                'available': exporter.has_reportlab,
+                'available': results_exporter.has_reportlab,
                 'extension': 'pdf',
-                'note': 'Requires reportlab package' if not exporter.has_reportlab else None
+                'note': 'Requires reportlab package' if not results_exporter.has_reportlab else None
             }
         }
         
         return jsonify({
             'formats': formats,
-            'matplotlib_available': exporter.has_matplotlib,
-            'reportlab_available': exporter.has_reportlab
+            'matplotlib_available': results_exporter.has_matplotlib,
+            'reportlab_available': results_exporter.has_reportlab
         })
         
     except Exception as e:
@@ -1508,29 +2256,42 @@ def get_export_formats():
         return jsonify({'error': str(e)}), 500
 
 
-# Sequential Write Performance Test API Endpoints
-@app.route('/api/tests/sequential_write/devices')
-def get_sequential_write_devices():
-    """Get list of available NVMe devices for sequential write performance test"""
+# Sequential Write and Random IOPS Performance Test API Endpoints
+# Both suites share one devices/run/export implementation, dispatched on the URL segment
+FIO_TEST_ROUTES = {
+    'sequential_write': {
+        'suite_id': 'sequential_write_performance',
+        'label': 'sequential write',
+        'request_schema': SEQUENTIAL_WRITE_REQUEST,
+        'filename_fields': ()
+    },
+    'random_iops': {
+        'suite_id': 'random_iops_performance',
+        'label': 'random IOPS',
+        'request_schema': RANDOM_IOPS_REQUEST,
+        'filename_fields': (('workload_type', 'randread'),)
+    }
+}
+_FIO_TEST_SEGMENT = f"<any({', '.join(FIO_TEST_ROUTES)}):test_name>"
+
+
+@app.route(f'/api/tests/{_FIO_TEST_SEGMENT}/devices')
+def get_fio_test_devices(test_name):
+    """Get list of available NVMe devices for a sequential write or random IOPS test"""
     if not TESTING_AVAILABLE:
         return jsonify({'error': 'Testing modules not available'}), 503
 
+    route = FIO_TEST_ROUTES[test_name]
     try:
         # Get available NVMe devices from test runner
-        test_runner = TestRunner()
-        
-        # Check if NVMe discovery has been run
-        available_tests = test_runner.list_available_tests()
-        sequential_write_test = next(
-            (test for test in available_tests if test['id'] == 'sequential_write_performance'), 
-            None
-        )
+        # Check if NVMe discovery has been run (and fio is present)
+        is_available, reason = test_runner.is_test_available(route['suite_id'])
         
-        if not sequential_write_test or not sequential_write_test['available']:
+        if not is_available:
             return jsonify({
                 'devices': [],
                 'available': False,
-                'reason': sequential_write_test['unavailable_reason'] if sequential_write_test else 'Test not found'
+                'reason': reason
             })
         
         # If devices are available, return them
@@ -1544,45 +2305,94 @@ def get_sequential_write_devices():
                 'path': f"/dev/{device.get('device', 'nvme0n1')}"
             })
         
-        return jsonify({
+        return _etag_json({
             'devices': devices,
             'available': True,
             'count': len(devices)
         })
         
     except Exception as e:
-        logger.error(f"Error getting sequential write devices: {e}")
+        logger.error(f"Error getting {route['label']} devices: {e}")
         return jsonify({'error': str(e)}), 500
 
 
-@app.route('/api/tests/sequential_write/run', methods=['POST'])
-def run_sequential_write_test():
-    """Run sequential write performance test with real-time monitoring"""
+@app.route(f'/api/tests/{_FIO_TEST_SEGMENT}/run', methods=['POST'])
+def run_fio_performance_test(test_name):
+    """Run a sequential write or random IOPS performance test"""
     if not TESTING_AVAILABLE:
         return jsonify({'error': 'Testing modules not available'}), 503
 
+    route = FIO_TEST_ROUTES[test_name]
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True)
         if not data:
             return jsonify({'error': 'No test configuration provided'}), 400
         
-        # Extract test configuration
-        options = {
-            'device': data.get('device', '/dev/nvme0n1'),
-            'runtime_seconds': data.get('runtime_seconds', 60),
-            'block_size': data.get('block_size', '128k'),
-            'queue_depth': data.get('queue_depth', 32)
-        }
-        
-        test_runner = TestRunner()
+        # Validate and extract test configuration
+        options, error = _parse_request_options(data, route['request_schema'])
+        if error:
+            return jsonify({'error': error}), 400
         
         # Run test
-        result = test_runner.run_test_suite('sequential_write_performance', options=options)
+        result = test_runner.run_test_suite(route['suite_id'], options=options)
         
         return jsonify(result)
 
     except Exception as e:
-        logger.error(f"Error running sequential write test: {e}")
+        logger.error(f"Error running {route['label']} test: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route(f'/api/tests/{_FIO_TEST_SEGMENT}/export', methods=['POST'])
+def export_fio_test_results(test_name):
+    """Export sequential write or random IOPS test results to various formats"""
+    if not TESTING_AVAILABLE:
+        return jsonify({'error': 'Testing modules not available'}), 503
+
+    route = FIO_TEST_ROUTES[test_name]
+    try:
+        data = request.get_json(silent=True)
+        if not data or 'results' not in data:
+            return jsonify({'error': 'No test results provided'}), 400
+        
+        options, error = _parse_request_options(data, EXPORT_REQUEST)
+        if error:
+            return jsonify({'error': error}), 400
+        
+        results = options['results']
+        export_format = options['format'].lower()
+        
+        if export_format not in EXPORT_MIMETYPES:
+            return jsonify({'error': 'format must be csv, html, or pdf'}), 400
+        
+        # Generate filename, e.g. random_iops_<workload>_<device>_<timestamp>.csv
+        name_parts = [test_name]
+        for field_name, default in route['filename_fields']:
+            name_parts.append(_UNSAFE_FILENAME_RE.sub('_', str(results.get(field_name, default))))
+        name_parts.append(_UNSAFE_FILENAME_RE.sub('_', str(results.get('device', 'unknown'))))
+        name_parts.append(_export_timestamp())
+        filename = f"{'_'.join(name_parts)}.{export_format}"
+        
+        if request.args.get('persist') != '1':
+            return _stream_export(results, export_format, filename)
+        
+        # Persist a copy under logs/ only when explicitly requested
+        output_path = os.path.join('logs', filename)
+        
+        success = results_exporter.export_results(results, export_format, output_path)
+        
+        if success and os.path.exists(output_path):
+            return jsonify({
+                'success': True,
+                'filename': filename,
+                'path': output_path,
+                'format': export_format
+            })
+        else:
+            return jsonify({'error': 'Failed to export results'}), 500
+        
+    except Exception as e:
+        logger.error(f"Error exporting {route['label']} results: {e}")
         return jsonify({'error': str(e)}), 500
 
 
@@ -1594,12 +2404,18 @@ def handle_start_sequential_write_test(data):
         emit('performance_test_error', {'message': 'Testing modules not available'})
         return
 
+    # Run in the background; events go to the requesting client by sid
+    socketio.start_background_task(_run_sequential_write_test, request.sid, data)
+
+
+def _run_sequential_write_test(sid, data):
+    """Background task for handle_start_sequential_write_test"""
     def progress_callback(update):
-        emit('sequential_write_progress', update)
-    
-    def real_time_callback(metrics):
-        emit('sequential_write_metrics', metrics)
+        socketio.emit('sequential_write_progress', update, to=sid)
     
+    # Real-time metrics are coalesced and emitted in batches rather than per sample
+    real_time_callback, stop_realtime = _start_metric_batcher('sequential_write_metrics_batch', sid)
+
     try:
         from tests.sequential_write_performance import SequentialWritePerformanceTest
         
@@ -1615,8 +2431,9 @@ def handle_start_sequential_write_test(data):
             progress_callback=progress_callback,
             real_time_callback=real_time_callback
         )
+        stop_realtime()
         
-        emit('sequential_write_complete', {
+        socketio.emit('sequential_write_complete', {
             'status': 'completed',
             'result': {
                 'test_name': result.test_name,
@@ -1631,11 +2448,12 @@ def handle_start_sequential_write_test(data):
                 'warnings': result.warnings,
                 'errors': result.errors
             }
-        })
+        }, to=sid)
         
     except Exception as e:
+        stop_realtime()
         logger.error(f"Error in sequential write WebSocket test: {e}")
-        emit('performance_test_error', {'message': str(e)})
+        socketio.emit('performance_test_error', {'message': str(e)}, to=sid)
 
 
 @socketio.on('stop_sequential_write_test')
@@ -1647,130 +2465,6 @@ def handle_stop_sequential_write_test(data):
         logger.error(f"Error stopping sequential write test: {e}")
 
 
-@app.route('/api/tests/sequential_write/export', methods=['POST'])
-def export_sequential_write_results():
-    """Export sequential write test results to various formats"""
-    if not TESTING_AVAILABLE:
-        return jsonify({'error': 'Testing modules not available'}), 503
-
-    try:
-        data = request.get_json()
-        if not data or 'results' not in data:
-            return jsonify({'error': 'No test results provided'}), 400
-        
-        results = data['results']
-        export_format = data.get('format', 'csv').lower()
-        
-        # Generate filename
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        device_name = results.get('device', 'unknown').replace('/', '_').replace('\\', '_')
-        filename = f"sequential_write_{device_name}_{timestamp}.{export_format}"
-        output_path = os.path.join('logs', filename)
-        
-        # Ensure logs directory exists
-        os.makedirs('logs', exist_ok=True)
-        
-        from tests.results_exporter import ResultsExporter
-        exporter = ResultsExporter()
-        
-        # Export results
-        success = exporter.export_results(results, output_path, export_format)
-        
-        if success and os.path.exists(output_path):
-            return jsonify({
-                'success': True,
-                'filename': filename,
-                'path': output_path,
-                'format': export_format
-            })
-        else:
-            return jsonify({'error': 'Failed to export results'}), 500
-        
-    except Exception as e:
-        logger.error(f"Error exporting sequential write results: {e}")
-        return jsonify({'error': str(e)}), 500
-
-
-# Random IOPS Performance Test API Endpoints
-@app.route('/api/tests/random_iops/devices')
-def get_random_iops_devices():
-    """Get list of available NVMe devices for random IOPS performance test"""
-    if not TESTING_AVAILABLE:
-        return jsonify({'error': 'Testing modules not available'}), 503
-
-    try:
-        # Get available NVMe devices from test runner
-        test_runner = TestRunner()
-        
-        # Check if NVMe discovery has been run
-        available_tests = test_runner.list_available_tests()
-        random_iops_test = next(
-            (test for test in available_tests if test['id'] == 'random_iops_performance'), 
-            None
-        )
-        
-        if not random_iops_test or not random_iops_test['available']:
-            return jsonify({
-                'devices': [],
-                'available': False,
-                'reason': random_iops_test['unavailable_reason'] if random_iops_test else 'Test not found'
-            })
-        
-        # If devices are available, return them
-        devices = []
-        for device in test_runner.discovered_nvme_devices:
-            devices.append({
-                'device': device.get('device', 'unknown'),
-                'model': device.get('model', 'Unknown Model'),
-                'vendor': device.get('vendor', 'Unknown Vendor'),
-                'size': device.get('size', 'Unknown Size'),
-                'path': f"/dev/{device.get('device', 'nvme0n1')}"
-            })
-        
-        return jsonify({
-            'devices': devices,
-            'available': True,
-            'count': len(devices)
-        })
-        
-    except Exception as e:
-        logger.error(f"Error getting random IOPS devices: {e}")
-        return jsonify({'error': str(e)}), 500
-
-
-@app.route('/api/tests/random_iops/run', methods=['POST'])
-def run_random_iops_test():
-    """Run random IOPS performance test with real-time monitoring"""
-    if not TESTING_AVAILABLE:
-        return jsonify({'error': 'Testing modules not available'}), 503
-
-    try:
-        data = request.get_json()
-        if not data:
-            return jsonify({'error': 'No test configuration provided'}), 400
-        
-        # Extract test configuration
-        options = {
-            'device': data.get('device', '/dev/nvme0n1'),
-            'runtime_seconds': data.get('runtime_seconds', 60),
-            'block_size': data.get('block_size', '4k'),
-            'queue_depth': data.get('queue_depth', 64),
-            'workload_type': data.get('workload_type', 'randread'),
-            'read_write_ratio': data.get('read_write_ratio', '100:0')
-        }
-        
-        test_runner = TestRunner()
-        
-        # Run test
-        result = test_runner.run_test_suite('random_iops_performance', options=options)
-        
-        return jsonify(result)
-
-    except Exception as e:
-        logger.error(f"Error running random IOPS test: {e}")
-        return jsonify({'error': str(e)}), 500
-
-
 # WebSocket handlers for real-time random IOPS monitoring
 @socketio.on('start_random_iops_test')
 def handle_start_random_iops_test(data):
@@ -1779,12 +2473,19 @@ def handle_start_random_iops_test(data):
         emit('performance_test_error', {'message': 'Testing modules not available'})
         return
 
+    # Run in the background; events go to the requesting client by sid
+    socketio.start_background_task(_run_random_iops_test, request.sid, data)
+
+
+def _run_random_iops_test(sid, data):
+    """Background task for handle_start_random_iops_test"""
     def progress_callback(update):
-        emit('random_iops_progress', update)
-    
-    def real_time_callback(metrics):
-        emit('random_iops_metrics', metrics)
+        socketio.emit('random_iops_progress', update, to=sid)
     
+    # Real-time metrics are coalesced and emitted in batches rather than per sample
+    real_time_callback, stop_realtime = _start_metric_batcher('random_iops_metrics_bin', sid,
+                                                              RANDOM_IOPS_METRIC_FIELDS)
+
     try:
         from tests.random_iops_performance import RandomIOPSPerformanceTest
         
@@ -1800,32 +2501,20 @@ def handle_start_random_iops_test(data):
             read_write_ratio=data.get('read_write_ratio', '100:0'),
             discovered_devices=data.get('discovered_devices', []),
             progress_callback=progress_callback,
-            real_time_callback=real_time_callback
+            real_time_callback=real_time_callback,
+            stream=True
         )
+        stop_realtime()
         
-        emit('random_iops_complete', {
+        socketio.emit('random_iops_complete', {
             'status': 'completed',
-            'result': {
-                'test_name': result.test_name,
-                'status': result.status,
-                'device': result.device,
-                'workload_type': result.workload_type,
-                'read_iops': result.read_iops,
-                'write_iops': result.write_iops,
-                'total_iops': result.total_iops,
-                'read_avg_latency_us': result.read_avg_latency_us,
-                'write_avg_latency_us': result.write_avg_latency_us,
-                'cpu_utilization': result.cpu_utilization,
-                'compliance_status': result.compliance_status,
-                'duration_seconds': result.duration_seconds,
-                'warnings': result.warnings,
-                'errors': result.errors
-            }
-        })
+            'result': result.summary()
+        }, to=sid)
         
     except Exception as e:
+        stop_realtime()
         logger.error(f"Error in random IOPS WebSocket test: {e}")
-        emit('performance_test_error', {'message': str(e)})
+        socketio.emit('performance_test_error', {'message': str(e)}, to=sid)
 
 
 @socketio.on('stop_random_iops_test')
@@ -1837,54 +2526,7 @@ def handle_stop_random_iops_test(data):
         logger.error(f"Error stopping random IOPS test: {e}")
 
 
-@app.route('/api/tests/random_iops/export', methods=['POST'])
-def export_random_iops_results():
-    """Export random IOPS test results to various formats"""
-    if not TESTING_AVAILABLE:
-        return jsonify({'error': 'Testing modules not available'}), 503
-
-    try:
-        data = request.get_json()
-        if not data or 'results' not in data:
-            return jsonify({'error': 'No test results provided'}), 400
-        
-        results = data['results']
-        export_format = data.get('format', 'csv').lower()
-        
-        # Generate filename
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        device_name = results.get('device', 'unknown').replace('/', '_').replace('\\', '_')
-        workload = results.get('workload_type', 'randread')
-        filename = f"random_iops_{workload}_{device_name}_{timestamp}.{export_format}"
-        output_path = os.path.join('logs', filename)
-        
-        # Ensure logs directory exists
-        os.makedirs('logs', exist_ok=True)
-        
-        from tests.results_exporter import ResultsExporter
-        exporter = ResultsExporter()
-        
-        # Export results
-        success = exporter.export_results(results, output_path, export_format)
-        
-        if success and os.path.exists(output_path):
-            return jsonify({
-                'success': True,
-                'filename': filename,
-                'path': output_path,
-                'format': export_format
-            })
-        else:
-            return jsonify({'error': 'Failed to export results'}), 500
-        
-    except Exception as e:
-        logger.error(f"Error exporting random IOPS results: {e}")
-        return jsonify({'error': str(e)}), 500
-
-
 if __name__ == '__main__':
-    os.makedirs('logs', exist_ok=True)
-
     print("CalypsoPy+ by Serial Cables")
     print("Serial Cables Gen6 PCIe Atlas 3 Host Card Development Interface")
     print("=" * 50)
@@ -11,6 +11,74 @@ from typing import Dict, Any, List, Optional, Union
 
 logger = logging.getLogger(__name__)
 
+# Patterns are compiled once at import; the parse methods run them per line
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+
+# sysinfo section headers (the command names echoed before each block)
+_SECTION_NAMES = frozenset(('ver', 'lsd', 'spread', 'clk', 'showport', 'bist'))
+_MAX_SECTION_NAME_LEN = max(len(name) for name in _SECTION_NAMES)
+
+# VER section (Unicode box drawing or ASCII borders)
+_VER_PATTERNS = {
+    'company': re.compile(r'[║|]\s*Company\s*:\s*([^║|\r\n]+)', re.IGNORECASE),
+    'model': re.compile(r'[║|]\s*Model\s*:\s*([^║|\r\n]+)', re.IGNORECASE),
+    'serial_number': re.compile(r'[║|]\s*Serial No\.\s*:\s*([^║|\r\n]+)', re.IGNORECASE)
+}
+_MCU_VERSION_RE = re.compile(r'[║|]\s*Version\s*:\s*([0-9.]+)', re.IGNORECASE)
+_MCU_BUILD_RE = re.compile(r'[║|]\s*Build Time\s*:\s*([^║|\r\n]+)', re.IGNORECASE)
+_SBR_VERSION_RE = re.compile(r'[║|]\s*Version\s*:\s*([0-9A-Fa-f]+)', re.IGNORECASE)
+
+# LSD section
+_TEMPERATURE_RE = re.compile(r'[•·*]\s*Switch Temperature\s*:\s*(\d+)°C', re.IGNORECASE)
+_FAN_RE = re.compile(r'[•·*]\s*Switch Fan\s*:\s*(\d+)\s*RPM', re.IGNORECASE)
+_VOLTAGE_RE = re.compile(r'[•·*]\s*([\d.]+)V\s+Voltage\s*:\s*([\d.]+)\s*V', re.IGNORECASE)
+_POWER_VOLTAGE_RE = re.compile(r'[•·*]\s*Power Voltage\s*:\s*([\d.]+)\s*V', re.IGNORECASE)
+_LOAD_CURRENT_RE = re.compile(r'[•·*]\s*Load Current\s*:\s*([\d.]+)\s*A', re.IGNORECASE)
+_LOAD_POWER_RE = re.compile(r'[•·*]\s*Load Power\s*:\s*([\d.]+)\s*W', re.IGNORECASE)
+
+# BIST section
+_WHITESPACE_RE = re.compile(r'\s+')
+_NON_ALNUM_RE = re.compile(r'[^A-Za-z0-9]')
+
+# showport output: detailed table rows, simplified "PortNN : speed .." rows and the golden finger line
+_CHIP_VERSION_RE = re.compile(r'Atlas3 chip ver:\s*([A-Z0-9]+)')
+_PORT_DETAIL_RE = re.compile(r'(\w+)\s*\|\s*Port\s*(\d+)\s*\|\s*Speed:\s*(\w+)\s*\|\s*Width:\s*(\d+)\s*\|\s*Max:\s*(\w+)\s*x(\d+)\s*\|\s*Status:\s*(\w+)')
+_PORT_SIMPLE_RE = re.compile(r'Port(\d+)\s*:\s*speed\s*(\d+),\s*width\s*(\d+),\s*max_speed(\d+),\s*max_width(\d+)')
+_GOLDEN_FINGER_RE = re.compile(r'(?:Golden|gold)\s+finger:\s*speed\s*(\d+),\s*width\s*(\d+),\s*max_width\s*=\s*(\d+)', re.IGNORECASE)
+
+# Physical port ranges on the Atlas 3 card: (first, last, location group, location name)
+_PORT_LOCATIONS = (
+    (0, 32, 'gold_finger', 'Gold Finger (GF)'),
+    (80, 95, 'straddle_mount', 'Straddle Mount'),
+    (112, 119, 'upper_left_mcio', 'Upper Left MCIO (UL)'),
+    (120, 127, 'lower_left_mcio', 'Lower Left MCIO (LL)'),
+    (128, 135, 'upper_right_mcio', 'Upper Right MCIO (UR)'),
+    (136, 143, 'lower_right_mcio', 'Lower Right MCIO (LR)')
+)
+_LOCATION_BY_PORT = {
+    port: (group, name)
+    for first, last, group, name in _PORT_LOCATIONS
+    for port in range(first, last + 1)
+}
+
+# sysinfo port summary lists by port number (coarser than the physical locations)
+_SUMMARY_BUCKET_BY_PORT = {
+    port: bucket
+    for first, last, bucket in (
+        (0, 32, 'upstream_ports'),
+        (80, 95, 'straddle_ports'),
+        (112, 127, 'ext_mcio_ports'),
+        (128, 143, 'int_mcio_ports')
+    )
+    for port in range(first, last + 1)
+}
+
+# showmode / clk / spread
+_SBR_MODE_RE = re.compile(r'SBR\s+mode:\s*(\d+)', re.IGNORECASE)
+_PORT_GROUP_RE = re.compile(r'Port Group (\d+):\s*(\w+)', re.IGNORECASE)
+_SPREAD_PERCENT_RE = re.compile(r'([+-]?[\d.]+)%')
+_FREQUENCY_RE = re.compile(r'([\d.]+)\s*(\w+)')
+
 class Atlas3Parser:
     """
     Professional parsing engine for Atlas 3 Host Card command responses.
@@ -128,25 +196,25 @@ class Atlas3Parser:
     def _split_into_sections(self, response: str) -> Dict[str, str]:
         """Split sysinfo response into ver, lsd, spread, clk, showport, and bist sections"""
         sections = {}
-        lines = response.split('\n')
         current_section = None
         section_content = []
         
-        for line in lines:
+        for line in response.splitlines():
             line = line.strip()
             
-            # Detect main section headers (command names)
-            if line.lower() in ['ver', 'lsd', 'spread', 'clk', 'showport', 'bist']:
-                # Save previous section before starting new one
-                if current_section and section_content:
-                    sections[current_section] = '\n'.join(section_content)
-                    section_content = []
-                current_section = line.lower()
-                continue
+            # Detect main section headers (command names); only short lines can match
+            if len(line) <= _MAX_SECTION_NAME_LEN:
+                section_name = line.lower()
+                if section_name in _SECTION_NAMES:
+                    # Save previous section before starting new one
+                    if current_section and section_content:
+                        sections[current_section] = '\n'.join(section_content)
+                        section_content = []
+                    current_section = section_name
+                    continue
             
             # Detect main section separators (80+ characters of =)
-            if '=' in line and len(line) > 75:
-                # Check if next non-empty line is a section name
+            elif len(line) > 75 and '=' in line:
                 continue
             
             # Add content to current section (including sub-section separators)
@@ -164,26 +232,19 @@ class Atlas3Parser:
         device_info = {}
         
         # Strip ANSI escape sequences first
-        clean_content = re.sub(r'\x1b\[[0-9;]*m', '', ver_content)
-        
-        # Updated patterns for Unicode box drawing characters
-        patterns = {
-            'company': r'[║|]\s*Company\s*:\s*([^║|\r\n]+)',
-            'model': r'[║|]\s*Model\s*:\s*([^║|\r\n]+)',
-            'serial_number': r'[║|]\s*Serial No\.\s*:\s*([^║|\r\n]+)'
-        }
+        clean_content = _ANSI_RE.sub('', ver_content)
         
-        for field, pattern in patterns.items():
-            match = re.search(pattern, clean_content, re.IGNORECASE)
+        for field, pattern in _VER_PATTERNS.items():
+            match = pattern.search(clean_content)
             if match:
                 device_info[field] = match.group(1).strip()
         
         # Extract MCU version and build time
-        mcu_version_match = re.search(r'[║|]\s*Version\s*:\s*([0-9.]+)', clean_content, re.IGNORECASE)
+        mcu_version_match = _MCU_VERSION_RE.search(clean_content)
         if mcu_version_match:
             device_info['mcu_version'] = mcu_version_match.group(1).strip()
         
-        mcu_build_match = re.search(r'[║|]\s*Build Time\s*:\s*([^║|\r\n]+)', clean_content, re.IGNORECASE)
+        mcu_build_match = _MCU_BUILD_RE.search(clean_content)
         if mcu_build_match:
             device_info['mcu_build_time'] = mcu_build_match.group(1).strip()
         
@@ -194,7 +255,7 @@ class Atlas3Parser:
             if 'SBR Info' in line:
                 in_sbr_section = True
             elif in_sbr_section and 'Version' in line:
-                sbr_match = re.search(r'[║|]\s*Version\s*:\s*([0-9A-Fa-f]+)', line, re.IGNORECASE)
+                sbr_match = _SBR_VERSION_RE.search(line)
                 if sbr_match:
                     device_info['sbr_version'] = sbr_match.group(1).strip()
                     break
@@ -208,7 +269,7 @@ class Atlas3Parser:
         power_consumption = {}
         
         # Strip ANSI escape sequences first
-        clean_content = re.sub(r'\x1b\[[0-9;]*m', '', lsd_content)
+        clean_content = _ANSI_RE.sub('', lsd_content)
         lines = clean_content.split('\n')
         
         for line in lines:
@@ -217,7 +278,7 @@ class Atlas3Parser:
                 continue
                 
             # Switch Temperature - look for bullet point (•) or similar
-            temp_match = re.search(r'[•·*]\s*Switch Temperature\s*:\s*(\d+)°C', line, re.IGNORECASE)
+            temp_match = _TEMPERATURE_RE.search(line)
             if temp_match:
                 thermal_data['switch_temperature'] = {
                     'value': int(temp_match.group(1)),
@@ -227,7 +288,7 @@ class Atlas3Parser:
                 continue
             
             # Switch Fan Speed
-            fan_match = re.search(r'[•·*]\s*Switch Fan\s*:\s*(\d+)\s*RPM', line, re.IGNORECASE)
+            fan_match = _FAN_RE.search(line)
             if fan_match:
                 thermal_data['fan_speed'] = {
                     'value': int(fan_match.group(1)),
@@ -237,7 +298,7 @@ class Atlas3Parser:
                 continue
             
             # Voltage Rails
-            voltage_match = re.search(r'[•·*]\s*([\d.]+)V\s+Voltage\s*:\s*([\d.]+)\s*V', line, re.IGNORECASE)
+            voltage_match = _VOLTAGE_RE.search(line)
             if voltage_match:
                 nominal_voltage = float(voltage_match.group(1))
                 measured_voltage = float(voltage_match.group(2))
@@ -254,7 +315,7 @@ class Atlas3Parser:
                 continue
             
             # Power Voltage
-            power_voltage_match = re.search(r'[•·*]\s*Power Voltage\s*:\s*([\d.]+)\s*V', line, re.IGNORECASE)
+            power_voltage_match = _POWER_VOLTAGE_RE.search(line)
             if power_voltage_match:
                 power_consumption['power_voltage'] = {
                     'value': float(power_voltage_match.group(1)),
@@ -263,7 +324,7 @@ class Atlas3Parser:
                 continue
             
             # Load Current
-            current_match = re.search(r'[•·*]\s*Load Current\s*:\s*([\d.]+)\s*A', line, re.IGNORECASE)
+            current_match = _LOAD_CURRENT_RE.search(line)
             if current_match:
                 current_a = float(current_match.group(1))
                 power_consumption['load_current'] = {
@@ -274,7 +335,7 @@ class Atlas3Parser:
                 continue
             
             # Load Power
-            power_match = re.search(r'[•·*]\s*Load Power\s*:\s*([\d.]+)\s*W', line, re.IGNORECASE)
+            power_match = _LOAD_POWER_RE.search(line)
             if power_match:
                 power_consumption['load_power'] = {
                     'value': float(power_match.group(1)),
@@ -288,10 +349,10 @@ class Atlas3Parser:
         """Parse the SPREAD section for spread spectrum status"""
         spread_status = {}
         
-        for line in spread_content.split('\n'):
-            line = line.strip()
+        # Strip ANSI escape sequences first (as the other sections do)
+        for line in _ANSI_RE.sub('', spread_content).split('\n'):
             if 'Spread status:' in line:
-                status = line.split(':', 1)[1].strip()
+                status = line.partition(':')[2].strip()
                 spread_status = {
                     'status': status.lower(),
                     'enabled': status.upper() == 'ON'
@@ -308,8 +369,8 @@ class Atlas3Parser:
             'int_mcio_clock': False
         }
         
-        for line in clk_content.split('\n'):
-            line = line.strip()
+        # Strip ANSI escape sequences first (as the other sections do)
+        for line in _ANSI_RE.sub('', clk_content).split('\n'):
             if 'PCIe Straddle' in line and 'enable' in line:
                 clock_status['pcie_straddle_clock'] = True
             elif 'EXT MCIO' in line and 'enable' in line:
@@ -329,7 +390,7 @@ class Atlas3Parser:
         }
         
         # Strip ANSI escape sequences first
-        clean_content = re.sub(r'\x1b\[[0-9;]*m', '', bist_content)
+        clean_content = _ANSI_RE.sub('', bist_content)
         lines = clean_content.split('\n')
         
         for line in lines:
@@ -338,7 +399,7 @@ class Atlas3Parser:
                 continue
             
             # Parse device entries - be more flexible with whitespace
-            parts = re.split(r'\s+', line)
+            parts = _WHITESPACE_RE.split(line)
             if len(parts) >= 4:
                 channel = parts[0]
                 device = parts[1]
@@ -346,7 +407,7 @@ class Atlas3Parser:
                 status = parts[3]
                 
                 # Clean status of any remaining artifacts
-                status_clean = re.sub(r'[^A-Za-z0-9]', '', status)
+                status_clean = _NON_ALNUM_RE.sub('', status)
                 
                 device_result = {
                     'channel': channel,
@@ -378,7 +439,7 @@ class Atlas3Parser:
         }
         
         # Strip ANSI escape sequences first
-        clean_content = re.sub(r'\x1b\[[0-9;]*m', '', showport_content)
+        clean_content = _ANSI_RE.sub('', showport_content)
         lines = clean_content.split('\n')
         current_section = None
         
@@ -388,12 +449,12 @@ class Atlas3Parser:
                 continue
                 
             # Skip separator lines (lots of = characters) but not data lines with single =
-            if '=' in line and len([c for c in line if c == '=']) > 5:
+            if line.count('=') > 5:
                 continue
             
             # Extract Atlas3 version
             if 'Atlas3 chip ver:' in line:
-                version_match = re.search(r'Atlas3 chip ver:\s*([A-Z0-9]+)', line)
+                version_match = _CHIP_VERSION_RE.search(line)
                 if version_match:
                     port_summary['atlas3_version'] = version_match.group(1)
                 continue
@@ -413,12 +474,12 @@ class Atlas3Parser:
                 continue
             
             # Parse port entries - handle both detailed and simplified formats
-            port_match = re.search(r'(\w+)\s*\|\s*Port\s*(\d+)\s*\|\s*Speed:\s*(\w+)\s*\|\s*Width:\s*(\d+)\s*\|\s*Max:\s*(\w+)\s*x(\d+)\s*\|\s*Status:\s*(\w+)', line)
+            port_match = _PORT_DETAIL_RE.search(line)
             
             # Try simplified format if detailed format doesn't match
             if not port_match:
                 # Format: "Port80 : speed 06, width 08, max_speed06, max_width08"
-                simple_match = re.search(r'Port(\d+)\s*:\s*speed\s*(\d+),\s*width\s*(\d+),\s*max_speed(\d+),\s*max_width(\d+)', line)
+                simple_match = _PORT_SIMPLE_RE.search(line)
                 if simple_match:
                     port_number = int(simple_match.group(1))
                     speed_code = simple_match.group(2)
@@ -460,14 +521,9 @@ class Atlas3Parser:
                     }
                     
                     # Categorize by port number ranges
-                    if 0 <= port_number <= 32:
-                        port_summary['upstream_ports'].append(port_data)
-                    elif 80 <= port_number <= 95:
-                        port_summary['straddle_ports'].append(port_data)
-                    elif 112 <= port_number <= 127:
-                        port_summary['ext_mcio_ports'].append(port_data)
-                    elif 128 <= port_number <= 143:
-                        port_summary['int_mcio_ports'].append(port_data)
+                    bucket = _SUMMARY_BUCKET_BY_PORT.get(port_number)
+                    if bucket:
+                        port_summary[bucket].append(port_data)
                     
                     port_summary['total_ports'] += 1
                     if port_data['is_active']:
@@ -476,7 +532,7 @@ class Atlas3Parser:
             # Try parsing "Golden finger" line
             if 'Golden finger' in line or 'gold finger' in line:
                 # Format: "Golden finger: speed 06, width 08, max_width = 16"
-                gf_match = re.search(r'(?:Golden|gold)\s+finger:\s*speed\s*(\d+),\s*width\s*(\d+),\s*max_width\s*=\s*(\d+)', line, re.IGNORECASE)
+                gf_match = _GOLDEN_FINGER_RE.search(line)
                 if gf_match:
                     speed_code = gf_match.group(1)
                     width_code = gf_match.group(2)
@@ -528,7 +584,7 @@ class Atlas3Parser:
                 status = port_match.group(7)
                 
                 # Clean ANSI escape sequences from status and translate terminology
-                status = re.sub(r'\x1b\[[0-9;]*m', '', status).strip()
+                status = _ANSI_RE.sub('', status).strip()
                 if status.lower() == 'degraded':
                     status = 'Connected'
                 
@@ -622,7 +678,7 @@ class Atlas3Parser:
         
         try:
             # Strip ANSI escape sequences first
-            clean_response = re.sub(r'\x1b\[[0-9;]*m', '', raw_response)
+            clean_response = _ANSI_RE.sub('', raw_response)
             lines = clean_response.split('\n')
             current_section = None
             
@@ -632,12 +688,12 @@ class Atlas3Parser:
                     continue
                     
                 # Skip separator lines (lots of = characters) but not data lines with single =
-                if '=' in line and len([c for c in line if c == '=']) > 5:
+                if line.count('=') > 5:
                     continue
                 
                 # Extract Atlas3 version
                 if 'Atlas3 chip ver:' in line:
-                    version_match = re.search(r'Atlas3 chip ver:\s*([A-Z0-9]+)', line)
+                    version_match = _CHIP_VERSION_RE.search(line)
                     if version_match:
                         parsed['atlas3_version'] = version_match.group(1)
                     continue
@@ -659,13 +715,13 @@ class Atlas3Parser:
                 # Parse port entries - handle both detailed and simplified formats
                 
                 # Try detailed format first (from /temp/showport.txt)
-                port_match = re.search(r'(\w+)\s*\|\s*Port\s*(\d+)\s*\|\s*Speed:\s*(\w+)\s*\|\s*Width:\s*(\d+)\s*\|\s*Max:\s*(\w+)\s*x(\d+)\s*\|\s*Status:\s*(\w+)', line)
+                port_match = _PORT_DETAIL_RE.search(line)
                 
                 # Try simplified format (current hardware output)
-                simple_match = re.search(r'Port(\d+)\s*:\s*speed\s*(\d+),\s*width\s*(\d+),\s*max_speed(\d+),\s*max_width(\d+)', line)
+                simple_match = _PORT_SIMPLE_RE.search(line)
                 
                 # Try parsing "Golden finger" line
-                gf_match = re.search(r'(?:Golden|gold)\s+finger:\s*speed\s*(\d+),\s*width\s*(\d+),\s*max_width\s*=\s*(\d+)', line, re.IGNORECASE)
+                gf_match = _GOLDEN_FINGER_RE.search(line)
                 
                 if port_match:
                     # Handle detailed format
@@ -678,7 +734,7 @@ class Atlas3Parser:
                     status = port_match.group(7)
                     
                     # Clean ANSI escape sequences from status
-                    status = re.sub(r'\x1b\[[0-9;]*m', '', status).strip()
+                    status = _ANSI_RE.sub('', status).strip()
                     
                     # Translate hardware status terminology
                     if status.lower() == 'degraded':
@@ -852,37 +908,13 @@ class Atlas3Parser:
     
     def _get_physical_location(self, port_number: int) -> str:
         """Get the physical location name for a port number"""
-        if 0 <= port_number <= 32:
-            return 'Gold Finger (GF)'
-        elif 80 <= port_number <= 95:
-            return 'Straddle Mount'
-        elif 112 <= port_number <= 119:
-            return 'Upper Left MCIO (UL)'
-        elif 120 <= port_number <= 127:
-            return 'Lower Left MCIO (LL)'
-        elif 128 <= port_number <= 135:
-            return 'Upper Right MCIO (UR)'
-        elif 136 <= port_number <= 143:
-            return 'Lower Right MCIO (LR)'
-        else:
-            return f'Unknown Location (Port {port_number})'
+        location = _LOCATION_BY_PORT.get(port_number)
+        return location[1] if location else f'Unknown Location (Port {port_number})'
     
     def _get_location_group(self, port_number: int) -> str:
         """Get the location group key for a port number"""
-        if 0 <= port_number <= 32:
-            return 'gold_finger'
-        elif 80 <= port_number <= 95:
-            return 'straddle_mount'
-        elif 112 <= port_number <= 119:
-            return 'upper_left_mcio'
-        elif 120 <= port_number <= 127:
-            return 'lower_left_mcio'
-        elif 128 <= port_number <= 135:
-            return 'upper_right_mcio'
-        elif 136 <= port_number <= 143:
-            return 'lower_right_mcio'
-        else:
-            return None
+        location = _LOCATION_BY_PORT.get(port_number)
+        return location[0] if location else None
     
     def _compare_speed(self, speed1: str, speed2: str) -> int:
         """Compare two PCIe speed strings. Returns 1 if speed1 > speed2, -1 if speed1 < speed2, 0 if equal"""
@@ -909,7 +941,7 @@ class Atlas3Parser:
         
         try:
             # Extract SBR mode number
-            mode_match = re.search(r'SBR\s+mode:\s*(\d+)', raw_response, re.IGNORECASE)
+            mode_match = _SBR_MODE_RE.search(raw_response)
             if mode_match:
                 parsed['firmware_config'] = int(mode_match.group(1))
         except Exception as e:
@@ -950,7 +982,7 @@ class Atlas3Parser:
             # Parse port group status
             lines = raw_response.split('\n')
             for line in lines:
-                match = re.search(r'Port Group (\d+):\s*(\w+)', line, re.IGNORECASE)
+                match = _PORT_GROUP_RE.search(line)
                 if match:
                     group_num = int(match.group(1))
                     status = match.group(2).lower()
@@ -988,29 +1020,29 @@ class Atlas3Parser:
                 
                 # Parse Spread Spectrum Clocking status
                 if 'Spread Spectrum Clocking:' in line:
-                    status = line.split(':', 1)[1].strip().upper()
+                    status = line.partition(':')[2].strip().upper()
                     parsed['spread_enabled'] = status == 'ENABLED'
                 
                 # Parse Spread Percentage
                 elif 'Spread Percentage:' in line:
-                    percentage_match = re.search(r'([+-]?[\d.]+)%', line)
+                    percentage_match = _SPREAD_PERCENT_RE.search(line)
                     if percentage_match:
                         parsed['spread_percentage'] = percentage_match.group(1)
                 
                 # Parse Modulation Frequency
                 elif 'Modulation Frequency:' in line:
-                    freq_match = re.search(r'([\d.]+)\s*(\w+)', line.split(':', 1)[1])
+                    freq_match = _FREQUENCY_RE.search(line.partition(':')[2])
                     if freq_match:
                         parsed['modulation_frequency'] = f"{freq_match.group(1)} {freq_match.group(2)}"
                 
                 # Parse PCIe 6.x Compliance
                 elif 'PCIe 6.x Compliance:' in line:
-                    compliance = line.split(':', 1)[1].strip().upper()
+                    compliance = line.partition(':')[2].strip().upper()
                     parsed['pcie6x_compliance'] = compliance
                 
                 # Parse Spread Type
                 elif 'Spread Type:' in line:
-                    spread_type = line.split(':', 1)[1].strip()
+                    spread_type = line.partition(':')[2].strip()
                     parsed['spread_type'] = spread_type
                     
         except Exception as e:
@@ -17,6 +17,7 @@ class RandomIOPSPerformance {
             cpu_usage: []
         };
         this.maxDataPoints = 60; // Keep last 60 seconds of data
+        this.chartRedrawPending = false;
         
         this.init();
     }
@@ -74,8 +75,8 @@ class RandomIOPSPerformance {
             this.handleProgressUpdate(data);
         });
 
-        this.socket.on('random_iops_realtime', (data) => {
-            this.handleRealtimeUpdate(data);
+        this.socket.on('random_iops_metrics_bin', (packet) => {
+            this.handleRealtimeBatch(this.decodeMetricBatch(packet));
         });
 
         this.socket.on('random_iops_complete', (data) => {
@@ -379,13 +380,56 @@ class RandomIOPSPerformance {
         }
     }
 
-    handleRealtimeUpdate(data) {
-        if (data.type === 'progress') {
-            // Add data point to real-time charts
-            const timestamp = new Date();
-            
-            this.realtimeData.timestamps.push(timestamp);
-            
+    decodeMetricBatch(packet) {
+        // Row-major little-endian float64 values, one row of packet.fields per sample
+        const bytes = packet.samples instanceof ArrayBuffer ? new Uint8Array(packet.samples) : packet.samples;
+        const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+        const rowSize = packet.fields.length * 8;
+        const updates = [];
+
+        for (let offset = 0; offset + rowSize <= view.byteLength; offset += rowSize) {
+            const sample = { type: 'metrics' };
+            packet.fields.forEach((field, index) => {
+                sample[field] = view.getFloat64(offset + index * 8, true);
+            });
+            updates.push(sample);
+        }
+
+        return updates;
+    }
+
+    handleRealtimeBatch(updates) {
+        // Server coalesces samples; add them all, then redraw once on the next frame
+        let added = false;
+        updates.forEach(data => {
+            added = this.addRealtimePoint(data) || added;
+        });
+
+        if (added && !this.chartRedrawPending) {
+            this.chartRedrawPending = true;
+            requestAnimationFrame(() => {
+                this.chartRedrawPending = false;
+                this.updateRealtimeCharts();
+            });
+        }
+    }
+
+    addRealtimePoint(data) {
+        if (data.type !== 'progress' && data.type !== 'metrics') {
+            return false;
+        }
+
+        // Add data point to real-time charts
+        const timestamp = new Date();
+        
+        this.realtimeData.timestamps.push(timestamp);
+        
+        if (data.type === 'metrics') {
+            // Measured samples decoded from the binary metrics channel
+            this.realtimeData.iops.push(data.total_iops);
+            this.realtimeData.latency.push(data.latency_us);
+            this.realtimeData.cpu_usage.push(data.cpu_usage);
+        } else {
             // Simulate IOPS-specific metrics
             const baseIOPS = data.workload_type === 'randread' ? 400000 : 
                              data.workload_type === 'randwrite' ? 250000 : 300000;
@@ -393,16 +437,16 @@ class RandomIOPSPerformance {
             this.realtimeData.iops.push(Math.random() * baseIOPS * 0.3 + baseIOPS * 0.7); // Simulated IOPS
             this.realtimeData.latency.push(Math.random() * 50 + 20); // Simulated latency for 4K random I/O
             this.realtimeData.cpu_usage.push(Math.random() * 35 + 20); // Simulated CPU usage for IOPS testing
+        }
 
-            // Limit data points
-            if (this.realtimeData.timestamps.length > this.maxDataPoints) {
-                Object.keys(this.realtimeData).forEach(key => {
-                    this.realtimeData[key].shift();
-                });
-            }
-
-            this.updateRealtimeCharts();
+        // Limit data points
+        if (this.realtimeData.timestamps.length > this.maxDataPoints) {
+            Object.keys(this.realtimeData).forEach(key => {
+                this.realtimeData[key].shift();
+            });
         }
+
+        return true;
     }
 
     handleTestComplete(data) {
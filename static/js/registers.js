@@ -173,7 +173,8 @@ class RegistersDashboard {
 
         // Parse and display formatted data
         try {
-            const parsed = this.parseRegisterResponse(rawResponse, commandType);
+            const parsed = this.registersFromServer(data.data.parsed, commandType)
+                || this.parseRegisterResponse(rawResponse, commandType);
             if (parsed) {
                 this.displayParsedData(parsed, commandType);
             }
@@ -193,6 +194,37 @@ class RegistersDashboard {
         return 'unknown';
     }
 
+    registersFromServer(serverParsed, commandType) {
+        // The server returns 'registers' column-wise: {address: [...], value: [...], ...}
+        const columns = serverParsed && serverParsed.registers;
+        if (!columns || !Array.isArray(columns.address) || !Array.isArray(columns.value)) {
+            return null;
+        }
+        if (columns.address.length === 0) return null;
+
+        switch (commandType) {
+            case 'read':
+            case 'write':
+                return {
+                    address: columns.address[0],
+                    value: columns.value[0],
+                    type: commandType
+                };
+            case 'dump_register':
+            case 'dump_port':
+                return {
+                    type: 'dump',
+                    registers: columns.address.map((address, index) => ({
+                        address: address,
+                        value: columns.value[index],
+                        offset: columns.offset ? columns.offset[index] : undefined
+                    }))
+                };
+            default:
+                return null;
+        }
+    }
+
     parseRegisterResponse(response, commandType) {
         switch (commandType) {
             case 'read':
@@ -17,6 +17,7 @@ class SequentialReadPerformance {
             cpu_usage: []
         };
         this.maxDataPoints = 60; // Keep last 60 seconds of data
+        this.chartRedrawPending = false;
         
         this.init();
     }
@@ -69,8 +70,8 @@ class SequentialReadPerformance {
             this.handleProgressUpdate(data);
         });
 
-        this.socket.on('performance_test_realtime', (data) => {
-            this.handleRealtimeUpdate(data);
+        this.socket.on('performance_test_realtime_batch', (updates) => {
+            this.handleRealtimeBatch(updates);
         });
 
         this.socket.on('performance_test_complete', (data) => {
@@ -316,28 +317,46 @@ class SequentialReadPerformance {
         }
     }
 
-    handleRealtimeUpdate(data) {
-        if (data.type === 'progress') {
-            // Add data point to real-time charts
-            const timestamp = new Date();
-            
-            this.realtimeData.timestamps.push(timestamp);
-            
-            // For now, we'll simulate some metrics since fio doesn't provide real-time metrics
-            // In a real implementation, you'd parse actual metrics from fio output
-            this.realtimeData.throughput.push(Math.random() * 5000 + 2000); // Simulated throughput
-            this.realtimeData.latency.push(Math.random() * 100 + 50); // Simulated latency
-            this.realtimeData.cpu_usage.push(Math.random() * 30 + 10); // Simulated CPU usage
-
-            // Limit data points
-            if (this.realtimeData.timestamps.length > this.maxDataPoints) {
-                Object.keys(this.realtimeData).forEach(key => {
-                    this.realtimeData[key].shift();
-                });
-            }
+    handleRealtimeBatch(updates) {
+        // Server coalesces samples; add them all, then redraw once on the next frame
+        let added = false;
+        updates.forEach(data => {
+            added = this.addRealtimePoint(data) || added;
+        });
+
+        if (added && !this.chartRedrawPending) {
+            this.chartRedrawPending = true;
+            requestAnimationFrame(() => {
+                this.chartRedrawPending = false;
+                this.updateRealtimeCharts();
+            });
+        }
+    }
 
-            this.updateRealtimeCharts();
+    addRealtimePoint(data) {
+        if (data.type !== 'progress') {
+            return false;
         }
+
+        // Add data point to real-time charts
+        const timestamp = new Date();
+        
+        this.realtimeData.timestamps.push(timestamp);
+        
+        // For now, we'll simulate some metrics since fio doesn't provide real-time metrics
+        // In a real implementation, you'd parse actual metrics from fio output
+        this.realtimeData.throughput.push(Math.random() * 5000 + 2000); // Simulated throughput
+        this.realtimeData.latency.push(Math.random() * 100 + 50); // Simulated latency
+        this.realtimeData.cpu_usage.push(Math.random() * 30 + 10); // Simulated CPU usage
+
+        // Limit data points
+        if (this.realtimeData.timestamps.length > this.maxDataPoints) {
+            Object.keys(this.realtimeData).forEach(key => {
+                this.realtimeData[key].shift();
+            });
+        }
+
+        return true;
     }
 
     handleTestComplete(data) {
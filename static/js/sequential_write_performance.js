@@ -17,6 +17,7 @@ class SequentialWritePerformance {
             cpu_usage: []
         };
         this.maxDataPoints = 60; // Keep last 60 seconds of data
+        this.chartRedrawPending = false;
         
         this.init();
     }
@@ -69,8 +70,8 @@ class SequentialWritePerformance {
             this.handleProgressUpdate(data);
         });
 
-        this.socket.on('sequential_write_realtime', (data) => {
-            this.handleRealtimeUpdate(data);
+        this.socket.on('sequential_write_metrics_batch', (updates) => {
+            this.handleRealtimeBatch(updates);
         });
 
         this.socket.on('sequential_write_complete', (data) => {
@@ -328,28 +329,46 @@ class SequentialWritePerformance {
         }
     }
 
-    handleRealtimeUpdate(data) {
-        if (data.type === 'progress') {
-            // Add data point to real-time charts
-            const timestamp = new Date();
-            
-            this.realtimeData.timestamps.push(timestamp);
-            
-            // For now, we'll simulate some metrics since fio doesn't provide real-time metrics
-            // In a real implementation, you'd parse actual metrics from fio output
-            this.realtimeData.throughput.push(Math.random() * 4000 + 1500); // Simulated write throughput (typically lower than read)
-            this.realtimeData.latency.push(Math.random() * 200 + 100); // Simulated write latency (typically higher than read)
-            this.realtimeData.cpu_usage.push(Math.random() * 40 + 15); // Simulated CPU usage (write intensive)
-
-            // Limit data points
-            if (this.realtimeData.timestamps.length > this.maxDataPoints) {
-                Object.keys(this.realtimeData).forEach(key => {
-                    this.realtimeData[key].shift();
-                });
-            }
+    handleRealtimeBatch(updates) {
+        // Server coalesces samples; add them all, then redraw once on the next frame
+        let added = false;
+        updates.forEach(data => {
+            added = this.addRealtimePoint(data) || added;
+        });
+
+        if (added && !this.chartRedrawPending) {
+            this.chartRedrawPending = true;
+            requestAnimationFrame(() => {
+                this.chartRedrawPending = false;
+                this.updateRealtimeCharts();
+            });
+        }
+    }
 
-            this.updateRealtimeCharts();
+    addRealtimePoint(data) {
+        if (data.type !== 'progress') {
+            return false;
         }
+
+        // Add data point to real-time charts
+        const timestamp = new Date();
+        
+        this.realtimeData.timestamps.push(timestamp);
+        
+        // For now, we'll simulate some metrics since fio doesn't provide real-time metrics
+        // In a real implementation, you'd parse actual metrics from fio output
+        this.realtimeData.throughput.push(Math.random() * 4000 + 1500); // Simulated write throughput (typically lower than read)
+        this.realtimeData.latency.push(Math.random() * 200 + 100); // Simulated write latency (typically higher than read)
+        this.realtimeData.cpu_usage.push(Math.random() * 40 + 15); // Simulated CPU usage (write intensive)
+
+        // Limit data points
+        if (this.realtimeData.timestamps.length > this.maxDataPoints) {
+            Object.keys(this.realtimeData).forEach(key => {
+                this.realtimeData[key].shift();
+            });
+        }
+
+        return true;
     }
 
     handleTestComplete(data) {
@@ -483,6 +483,10 @@ class TestingDashboard {
             })
         })
             .then(response => response.json())
+            .then(job => {
+                if (job.error) throw new Error(job.error);
+                return this.pollTestRun(job.run_id);
+            })
             .then(result => {
                 this.handleTestResult(testId, result);
             })
@@ -497,6 +501,21 @@ class TestingDashboard {
             });
     }
 
+    async pollTestRun(runId) {
+        // /api/tests/run queues the test; poll its status until the result is ready
+        while (true) {
+            await new Promise(resolve => setTimeout(resolve, 500));
+            const response = await fetch(`/api/tests/status/${runId}`);
+            const job = await response.json();
+            if (!response.ok) {
+                throw new Error(job.error || `HTTP ${response.status}`);
+            }
+            if (job.status === 'complete') {
+                return job.result;
+            }
+        }
+    }
+
     async runAllTests() {
         if (this.isRunning) {
             showNotification('Tests already running', 'warning');
@@ -523,7 +542,7 @@ class TestingDashboard {
             });
 
             if (response.ok) {
-                const result = await response.json();
+                const result = await this.readRunAllStream(response);
                 this.handleAllTestsResult(result);
             } else {
                 throw new Error(`HTTP ${response.status}`);
@@ -536,6 +555,40 @@ class TestingDashboard {
         }
     }
 
+    async readRunAllStream(response) {
+        // run_all streams NDJSON: a start line, one line per finished suite, then the summary
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        const runResult = { results: {} };
+        let buffered = '';
+
+        const handleLine = (line) => {
+            if (!line.trim()) return;
+            const message = JSON.parse(line);
+            if (message.type === 'result') {
+                runResult.results[message.suite_id] = message.result;
+                this.updateTestStatus(message.suite_id, message.result.status);
+            } else if (message.type === 'error') {
+                throw new Error(message.error);
+            } else {
+                const { type, ...fields } = message;
+                Object.assign(runResult, fields);
+            }
+        };
+
+        while (true) {
+            const { done, value } = await reader.read();
+            if (done) break;
+            buffered += decoder.decode(value, { stream: true });
+            const lines = buffered.split('\n');
+            buffered = lines.pop();
+            lines.forEach(handleLine);
+        }
+        handleLine(buffered + decoder.decode());
+
+        return runResult;
+    }
+
     updateTestStatus(testId, status) {
 	    const statusIndicator = document.getElementById(`${testId}Status`);
 	    const runButtons = document.querySelectorAll(`[data-test-id="${testId}"] .btn-test-run, [data-test-id="${testId}"] .btn-test-run-compact`);
@@ -18,6 +18,12 @@ import shutil
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 @dataclass
 class FioJobConfig:
@@ -70,6 +76,9 @@ class FioUtilities:
     Provides reusable functions for performance testing
     """
 
+    # Seconds between fio JSON status reports when streaming real-time metrics
+    STATUS_INTERVAL_SECONDS = 1
+
     def __init__(self):
         self.fio_path = self._find_fio_executable()
         self.has_fio = self.fio_path is not None
@@ -202,7 +211,8 @@ class FioUtilities:
                      device: str, 
                      job_config,  # Can be FioJobConfig or List[FioJobConfig]
                      progress_callback: Optional[Callable] = None,
-                     real_time_callback: Optional[Callable] = None) -> Dict[str, Any]:
+                     real_time_callback: Optional[Callable] = None,
+                     stream_status: bool = False) -> Dict[str, Any]:
         """
         Run fio test on specified device
         
@@ -211,6 +221,8 @@ class FioUtilities:
             jobs: List of fio job configurations
             progress_callback: Optional callback for progress updates
             real_time_callback: Optional callback for real-time metrics
+            stream_status: Feed real_time_callback from fio's JSON status reports
+                           instead of elapsed-time progress updates
             
         Returns:
             Test results with parsed metrics
@@ -251,12 +263,17 @@ class FioUtilities:
             # Prepare fio command
             output_file = os.path.join(os.path.dirname(job_file), f"{test_id}_output.json")
             
+            streaming = stream_status and real_time_callback is not None
             cmd = [
                 self.fio_path,
                 job_file,
-                '--output-format=json',
-                f'--output={output_file}'
+                '--output-format=json'
             ]
+            if streaming:
+                # Status reports and the final report are all written to stdout
+                cmd.append(f'--status-interval={self.STATUS_INTERVAL_SECONDS}')
+            else:
+                cmd.append(f'--output={output_file}')
 
             logger.info(f"Running fio test on {device}: {' '.join(cmd)}")
 
@@ -277,17 +294,45 @@ class FioUtilities:
                 text=True
             )
 
-            # Monitor process for real-time updates
-            if real_time_callback:
-                monitor_thread = threading.Thread(
-                    target=self._monitor_fio_process,
-                    args=(process, device, real_time_callback, start_time, jobs[0].runtime if jobs else 60)
+            total_runtime = jobs[0].runtime if jobs else 60
+            if streaming:
+                # Drain stderr alongside stdout so a chatty fio can't fill the pipe and stall
+                stderr_chunks = []
+                stderr_thread = threading.Thread(
+                    target=lambda: stderr_chunks.append(process.stderr.read())
                 )
-                monitor_thread.daemon = True
-                monitor_thread.start()
-
-            # Wait for completion
-            stdout, stderr = process.communicate()
+                stderr_thread.daemon = True
+                stderr_thread.start()
+
+                # Parse status reports as they arrive; the last one is the final result
+                final_report = self._stream_fio_status(process, device, real_time_callback,
+                                                       start_time, total_runtime)
+                process.wait()
+                stderr_thread.join()
+                stderr = ''.join(stderr_chunks)
+                if final_report is None and process.returncode == 0:
+                    error_msg = f"fio exited without a final report\nstderr: {stderr}"
+                    logger.error(error_msg)
+                    return {
+                        'success': False,
+                        'error': error_msg,
+                        'results': []
+                    }
+                if final_report is not None:
+                    with open(output_file, 'w') as f:
+                        json.dump(final_report, f)
+            else:
+                # Monitor process for real-time updates
+                if real_time_callback:
+                    monitor_thread = threading.Thread(
+                        target=self._monitor_fio_process,
+                        args=(process, device, real_time_callback, start_time, total_runtime)
+                    )
+                    monitor_thread.daemon = True
+                    monitor_thread.start()
+
+                # Wait for completion
+                stdout, stderr = process.communicate()
             end_time = time.time()
 
             if process.returncode != 0:
@@ -361,6 +406,100 @@ class FioUtilities:
         except Exception as e:
             logger.error(f"Error monitoring fio process: {str(e)}")
 
+    def _stream_fio_status(self,
+                           process: subprocess.Popen,
+                           device: str,
+                           callback: Callable,
+                           start_time: float,
+                           total_runtime: int = 60) -> Optional[Dict[str, Any]]:
+        """
+        Parse fio JSON status reports from stdout as they are written
+
+        Each report is a pretty-printed JSON document closed by a bare '}' line.
+        fio reports cumulative totals, so per-interval IOPS are derived from the
+        total_ios delta between consecutive reports.
+
+        Returns:
+            The last report seen (fio's final result), or None
+        """
+        report = None
+        lines = []
+        prev_read_ios = prev_write_ios = 0
+        prev_runtime_ms = 0
+
+        try:
+            for line in process.stdout:
+                if not lines and not line.startswith('{'):
+                    continue  # Skip anything fio prints outside a report
+                lines.append(line)
+                if line.rstrip() != '}':
+                    continue
+
+                document = ''.join(lines)
+                lines = []
+                try:
+                    report = orjson.loads(document) if ORJSON_AVAILABLE else json.loads(document)
+                except ValueError:
+                    logger.warning("Skipping malformed fio status report")
+                    continue
+
+                jobs = report.get('jobs')
+                if not jobs:
+                    continue
+
+                # group_reporting folds every job into the first entry
+                job = jobs[0]
+                read_data = job.get('read', {})
+                write_data = job.get('write', {})
+                read_ios = read_data.get('total_ios', 0)
+                write_ios = write_data.get('total_ios', 0)
+                runtime_ms = job.get('job_runtime', 0)
+
+                interval = (runtime_ms - prev_runtime_ms) / 1000.0
+                if interval <= 0:
+                    continue
+
+                read_iops = (read_ios - prev_read_ios) / interval
+                write_iops = (write_ios - prev_write_ios) / interval
+                prev_read_ios, prev_write_ios, prev_runtime_ms = read_ios, write_ios, runtime_ms
+
+                # Mean completion latency so far, weighted by I/O count
+                total_ios = read_ios + write_ios
+                latency_ns = 0.0
+                if total_ios:
+                    latency_ns = (read_data.get('lat_ns', {}).get('mean', 0) * read_ios +
+                                  write_data.get('lat_ns', {}).get('mean', 0) * write_ios) / total_ios
+
+                elapsed = time.time() - start_time
+                sample = {
+                    'type': 'metrics',
+                    'device': device,
+                    'timestamp': time.time(),
+                    'elapsed_seconds': elapsed,
+                    'total_runtime': total_runtime,
+                    'progress_percent': min((elapsed / total_runtime) * 100, 100) if total_runtime else 100,
+                    'status': 'running',
+                    'read_iops': read_iops,
+                    'write_iops': write_iops,
+                    'total_iops': read_iops + write_iops,
+                    'read_bw_mbps': read_data.get('bw', 0) / 1024.0,
+                    'write_bw_mbps': write_data.get('bw', 0) / 1024.0,
+                    'latency_us': latency_ns / 1000.0,
+                    'cpu_usage': job.get('usr_cpu', 0) + job.get('sys_cpu', 0)
+                }
+
+                # A failing consumer must not stop us draining fio's stdout
+                try:
+                    callback(sample)
+                except Exception as e:
+                    logger.warning(f"Real-time callback error: {str(e)}")
+
+        except Exception as e:
+            logger.error(f"Error streaming fio status: {str(e)}")
+            process.kill()
+
+        return report
+
     def _parse_fio_results(self, output_file: str, duration: float) -> List[FioResult]:
         """Parse fio JSON output into structured results"""
         results = []
@@ -12,6 +12,7 @@ This test:
 
 import subprocess
 import re
+import threading
 import time
 import logging
 from typing import Dict, List, Optional, Any, Tuple, Set
@@ -59,6 +60,7 @@ class LinkRetrainCount:
     MAX_RETRAIN_TIME_MS = 1000        # Max time for retrain (PCIe 6.x: 1000ms typical)
     MAX_RETRAIN_ATTEMPTS = 255        # Max retrain attempts before failure
     RETRAIN_TIMEOUT_MS = 5000         # Timeout for a single retrain attempt
+    ATLAS3_BUS_TTL_SECONDS = 60       # How long device listings may reuse the bus scan
 
     def __init__(self):
         """Initialize Link Retrain Count test"""
@@ -66,6 +68,15 @@ class LinkRetrainCount:
         self.has_sudo = self._check_sudo_access()
         self.has_setpci = self._check_setpci_available()
         self.atlas3_buses = set()  # Buses downstream of Atlas 3
+        self.sorted_atlas3_buses: Tuple[int, ...] = ()  # Same buses, ready for JSON responses
+        # Per-PCI-address topology answers; cleared when the Atlas 3 buses change.
+        # Device listings query these from a thread pool, so the caches, the bus
+        # set and the generation counter are only touched under _cache_lock.
+        self._downstream_cache: Dict[str, bool] = {}
+        self._endpoint_cache: Dict[str, bool] = {}
+        self._atlas3_buses_checked_at: Optional[float] = None
+        self._cache_generation = 0
+        self._cache_lock = threading.Lock()
 
         if self.has_root:
             self.permission_level = "root"
@@ -140,47 +151,96 @@ class LinkRetrainCount:
         """
         atlas3_buses = set()
 
-        # Get all PCIe devices
-        output = self._run_command(['lspci', '-nn'])
-        if not output:
+        # Only Atlas 3 functions are queried: a single lspci filtered by vendor:device
+        # returns every bridge's details, instead of listing all PCIe devices and then
+        # running lspci again for each bridge found
+        output = self._run_command(
+            ['lspci', '-vvv', '-d', f'{self.ATLAS3_VENDOR_ID}:{self.ATLAS3_DEVICE_ID}'],
+            use_sudo=self.has_sudo
+        )
+        if output is None:
             logger.warning("Failed to run lspci")
             return atlas3_buses
 
-        # Find Atlas 3 root bridge and downstream ports
-        atlas3_bdfs = []
-        for line in output.strip().split('\n'):
-            # Look for Atlas 3 devices (vendor 1000, device c040)
-            if f'[{self.ATLAS3_VENDOR_ID}:{self.ATLAS3_DEVICE_ID}]' in line:
-                bdf_match = re.match(r'^([0-9a-f]{2}:[0-9a-f]{2}\.[0-9a-f])', line)
-                if bdf_match:
-                    atlas3_bdfs.append(bdf_match.group(1))
-
-        if not atlas3_bdfs:
+        # lspci -vvv separates devices with a blank line; each block starts with the BDF
+        blocks = [block for block in output.split('\n\n') if block.strip()]
+        if not blocks:
             logger.warning("No Atlas 3 devices found")
             return atlas3_buses
 
+        atlas3_bdfs = [block.split(None, 1)[0] for block in blocks]
         logger.info(f"Found {len(atlas3_bdfs)} Atlas 3 bridge(s): {atlas3_bdfs}")
 
         # For each Atlas 3 bridge, get subordinate bus range
-        for bdf in atlas3_bdfs:
-            output = self._run_command(['lspci', '-vvv', '-s', bdf], use_sudo=self.has_sudo)
-            if output:
-                # Extract subordinate bus number
-                bus_match = re.search(r'Bus:\s+primary=([0-9a-f]+),\s+secondary=([0-9a-f]+),\s+subordinate=([0-9a-f]+)',
-                                      output)
-                if bus_match:
-                    subordinate_bus = int(bus_match.group(3), 16)
-                    secondary_bus = int(bus_match.group(2), 16)
-
-                    # Add all buses from secondary to subordinate
-                    for bus_num in range(secondary_bus, subordinate_bus + 1):
-                        atlas3_buses.add(bus_num)
-
-                    logger.info(f"Atlas 3 bridge {bdf}: buses {secondary_bus:02x}-{subordinate_bus:02x}")
+        for bdf, block in zip(atlas3_bdfs, blocks):
+            # Extract subordinate bus number
+            bus_match = re.search(r'Bus:\s+primary=([0-9a-f]+),\s+secondary=([0-9a-f]+),\s+subordinate=([0-9a-f]+)',
+                                  block)
+            if bus_match:
+                subordinate_bus = int(bus_match.group(3), 16)
+                secondary_bus = int(bus_match.group(2), 16)
+
+                # Add all buses from secondary to subordinate
+                atlas3_buses.update(range(secondary_bus, subordinate_bus + 1))
+
+                logger.info(f"Atlas 3 bridge {bdf}: buses {secondary_bus:02x}-{subordinate_bus:02x}")
 
         return atlas3_buses
 
+    def update_atlas3_buses(self, max_age: Optional[float] = None) -> Set[int]:
+        """
+        Re-identify Atlas 3 buses, dropping cached topology answers if they changed
+
+        With max_age, a scan younger than max_age seconds is reused instead of
+        running lspci again.
+        """
+        now = time.monotonic()
+        with self._cache_lock:
+            if (max_age is not None and self._atlas3_buses_checked_at is not None
+                    and now - self._atlas3_buses_checked_at < max_age):
+                return self.atlas3_buses
+
+        buses = self._identify_atlas3_buses()
+        with self._cache_lock:
+            if buses != self.atlas3_buses:
+                # Replace rather than mutate so lock-free readers see a whole set
+                self.atlas3_buses = buses
+                self.sorted_atlas3_buses = tuple(sorted(buses))
+                self._clear_topology_cache()
+            self._atlas3_buses_checked_at = now
+            return self.atlas3_buses
+
+    def invalidate_topology_cache(self):
+        """Forget cached downstream/endpoint checks (e.g. after hotplug or disconnect)"""
+        with self._cache_lock:
+            self._atlas3_buses_checked_at = None
+            self._clear_topology_cache()
+
+    def _clear_topology_cache(self):
+        """Drop cached topology answers; caller must hold _cache_lock"""
+        self._downstream_cache.clear()
+        self._endpoint_cache.clear()
+        # Checks already in flight were computed against the old topology
+        self._cache_generation += 1
+
+    def _cached_topology_check(self, cache: Dict[str, bool], pci_address: str, check) -> bool:
+        """Return cache[pci_address], running check outside the lock on a miss"""
+        with self._cache_lock:
+            cached = cache.get(pci_address)
+            generation = self._cache_generation
+        if cached is None:
+            cached = check(pci_address)
+            with self._cache_lock:
+                if generation == self._cache_generation:
+                    cache[pci_address] = cached
+        return cached
+
     def _is_device_atlas3_downstream(self, pci_address: str) -> bool:
+        """Cached wrapper for _check_device_atlas3_downstream"""
+        return self._cached_topology_check(self._downstream_cache, pci_address,
+                                           self._check_device_atlas3_downstream)
+
+    def _check_device_atlas3_downstream(self, pci_address: str) -> bool:
         """
         Check if a device is downstream of Atlas 3 switch (not the switch itself)
 
@@ -228,6 +288,11 @@ class LinkRetrainCount:
             return False
 
     def _is_endpoint_device(self, pci_address: str) -> bool:
+        """Cached wrapper for _check_endpoint_device"""
+        return self._cached_topology_check(self._endpoint_cache, pci_address,
+                                           self._check_endpoint_device)
+
+    def _check_endpoint_device(self, pci_address: str) -> bool:
         """
         Check if device is an endpoint (not a bridge/switch)
 
@@ -482,7 +547,7 @@ class LinkRetrainCount:
             return result
 
         # Identify Atlas 3 buses
-        self.atlas3_buses = self._identify_atlas3_buses()
+        self.update_atlas3_buses()
 
         if not self.atlas3_buses:
             result['warnings'].append('No Atlas 3 buses identified - cannot filter devices')
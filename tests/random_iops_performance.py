@@ -45,6 +45,15 @@ class PCIe6IOPSComplianceThresholds:
     min_iops_efficiency: float = 70.0             # 70% minimum IOPS efficiency
 
 
+# Result fields sent to the client when a test completes
+RESULT_SUMMARY_FIELDS = (
+    'test_name', 'status', 'device', 'workload_type',
+    'read_iops', 'write_iops', 'total_iops',
+    'read_avg_latency_us', 'write_avg_latency_us', 'cpu_utilization',
+    'compliance_status', 'duration_seconds', 'warnings', 'errors'
+)
+
+
 @dataclass
 class RandomIOPSTestResult:
     """Results from random IOPS performance test"""
@@ -92,6 +101,10 @@ class RandomIOPSTestResult:
     warnings: List[str] = field(default_factory=list)
     errors: List[str] = field(default_factory=list)
 
+    def summary(self) -> Dict[str, Any]:
+        """Client-facing subset of the result (see RESULT_SUMMARY_FIELDS)"""
+        return {name: getattr(self, name) for name in RESULT_SUMMARY_FIELDS}
+
 
 class RandomIOPSPerformanceTest:
     """
@@ -177,9 +190,13 @@ class RandomIOPSPerformanceTest:
                            read_write_ratio: str = "100:0",
                            discovered_devices: List[Dict] = None,
                            progress_callback: Optional[Callable] = None,
-                           real_time_callback: Optional[Callable] = None) -> RandomIOPSTestResult:
+                           real_time_callback: Optional[Callable] = None,
+                           stream: bool = False) -> RandomIOPSTestResult:
         """
         Run random IOPS performance test with real-time monitoring
+
+        With stream=True the real-time callback is fed from fio's own JSON
+        status reports rather than the simulated monitor.
         """
         start_time = time.time()
         self.is_running = True
@@ -241,7 +258,7 @@ class RandomIOPSPerformanceTest:
             
             # Start real-time monitoring thread if callback provided
             monitoring_thread = None
-            if real_time_callback:
+            if real_time_callback and not stream:
                 monitoring_thread = threading.Thread(
                     target=self._real_time_monitor,
                     args=(device, workload_type, runtime_seconds, real_time_callback),
@@ -250,7 +267,12 @@ class RandomIOPSPerformanceTest:
                 monitoring_thread.start()
             
             # Run fio test
-            fio_test_result = self.fio_utils.run_fio_test(device, job_config)
+            if stream and real_time_callback:
+                fio_test_result = self.fio_utils.run_fio_test(device, job_config,
+                                                              real_time_callback=real_time_callback,
+                                                              stream_status=True)
+            else:
+                fio_test_result = self.fio_utils.run_fio_test(device, job_config)
             
             if progress_callback:
                 progress_callback({
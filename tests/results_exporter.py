@@ -9,7 +9,7 @@ import csv
 import json
 import base64
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 from io import StringIO, BytesIO
 import logging
 
@@ -62,82 +62,7 @@ class ResultsExporter:
         """
         try:
             with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                
-                # Header information
-                writer.writerow(['CalypsoPy+ Sequential Read Performance Test Results'])
-                writer.writerow(['Generated:', datetime.now().isoformat()])
-                writer.writerow(['Test Name:', results.get('test_name', 'Unknown')])
-                writer.writerow(['Status:', results.get('status', 'Unknown')])
-                writer.writerow(['Device:', results.get('device', 'Unknown')])
-                writer.writerow(['Duration (s):', results.get('duration_seconds', 0)])
-                writer.writerow([])  # Empty row
-                
-                # Test Configuration
-                writer.writerow(['Test Configuration'])
-                config = results.get('configuration', {})
-                for key, value in config.items():
-                    writer.writerow([key.replace('_', ' ').title() + ':', value])
-                writer.writerow([])
-                
-                # Performance Metrics
-                writer.writerow(['Performance Metrics'])
-                metrics = results.get('performance_metrics', {})
-                writer.writerow(['Metric', 'Value', 'Unit'])
-                
-                metric_mappings = {
-                    'throughput_mbps': ('Throughput', 'MB/s'),
-                    'iops': ('IOPS', 'ops/sec'),
-                    'avg_latency_us': ('Average Latency', 'μs'),
-                    'p50_latency_us': ('50th Percentile Latency', 'μs'),
-                    'p90_latency_us': ('90th Percentile Latency', 'μs'),
-                    'p95_latency_us': ('95th Percentile Latency', 'μs'),
-                    'p99_latency_us': ('99th Percentile Latency', 'μs'),
-                    'cpu_utilization': ('CPU Utilization', '%'),
-                    'throughput_efficiency': ('Throughput Efficiency', '%')
-                }
-                
-                for key, (label, unit) in metric_mappings.items():
-                    value = metrics.get(key, 0)
-                    writer.writerow([label, f"{value:.2f}" if isinstance(value, float) else str(value), unit])
-                
-                writer.writerow([])
-                
-                # Compliance Results
-                writer.writerow(['PCIe 6.x Compliance'])
-                compliance = results.get('compliance', {})
-                writer.writerow(['Compliance Status:', compliance.get('status', 'Unknown')])
-                writer.writerow(['Detected PCIe Generation:', compliance.get('detected_pcie_gen', 'Unknown')])
-                writer.writerow(['Detected PCIe Lanes:', compliance.get('detected_pcie_lanes', 'Unknown')])
-                writer.writerow(['Expected Min Throughput (MB/s):', compliance.get('expected_min_throughput', 0)])
-                writer.writerow([])
-                
-                # Validation Results
-                writer.writerow(['Validation Results'])
-                writer.writerow(['Metric', 'Status', 'Actual', 'Expected', 'Description'])
-                
-                validations = compliance.get('validations', [])
-                for validation in validations:
-                    writer.writerow([
-                        validation.get('metric', ''),
-                        validation.get('status', ''),
-                        validation.get('actual', ''),
-                        validation.get('expected_min', validation.get('expected_max', '')),
-                        validation.get('description', '')
-                    ])
-                
-                # Warnings and Errors
-                if results.get('warnings'):
-                    writer.writerow([])
-                    writer.writerow(['Warnings'])
-                    for warning in results['warnings']:
-                        writer.writerow([warning])
-                
-                if results.get('errors'):
-                    writer.writerow([])
-                    writer.writerow(['Errors'])
-                    for error in results['errors']:
-                        writer.writerow([error])
+                csv.writer(csvfile).writerows(self._csv_rows(results))
 
             logger.info(f"CSV export completed: {output_path}")
             return True
@@ -146,6 +71,83 @@ class ResultsExporter:
             logger.error(f"Error exporting to CSV: {str(e)}")
             return False
 
+    def _csv_rows(self, results: Dict[str, Any]) -> Iterator[List[Any]]:
+        """Yield the CSV export of test results row by row"""
+        # Header information
+        yield ['CalypsoPy+ Sequential Read Performance Test Results']
+        yield ['Generated:', datetime.now().isoformat()]
+        yield ['Test Name:', results.get('test_name', 'Unknown')]
+        yield ['Status:', results.get('status', 'Unknown')]
+        yield ['Device:', results.get('device', 'Unknown')]
+        yield ['Duration (s):', results.get('duration_seconds', 0)]
+        yield []  # Empty row
+        
+        # Test Configuration
+        yield ['Test Configuration']
+        config = results.get('configuration', {})
+        for key, value in config.items():
+            yield [key.replace('_', ' ').title() + ':', value]
+        yield []
+        
+        # Performance Metrics
+        yield ['Performance Metrics']
+        metrics = results.get('performance_metrics', {})
+        yield ['Metric', 'Value', 'Unit']
+        
+        metric_mappings = {
+            'throughput_mbps': ('Throughput', 'MB/s'),
+            'iops': ('IOPS', 'ops/sec'),
+            'avg_latency_us': ('Average Latency', 'μs'),
+            'p50_latency_us': ('50th Percentile Latency', 'μs'),
+            'p90_latency_us': ('90th Percentile Latency', 'μs'),
+            'p95_latency_us': ('95th Percentile Latency', 'μs'),
+            'p99_latency_us': ('99th Percentile Latency', 'μs'),
+            'cpu_utilization': ('CPU Utilization', '%'),
+            'throughput_efficiency': ('Throughput Efficiency', '%')
+        }
+        
+        for key, (label, unit) in metric_mappings.items():
+            value = metrics.get(key, 0)
+            yield [label, f"{value:.2f}" if isinstance(value, float) else str(value), unit]
+        
+        yield []
+        
+        # Compliance Results
+        yield ['PCIe 6.x Compliance']
+        compliance = results.get('compliance', {})
+        yield ['Compliance Status:', compliance.get('status', 'Unknown')]
+        yield ['Detected PCIe Generation:', compliance.get('detected_pcie_gen', 'Unknown')]
+        yield ['Detected PCIe Lanes:', compliance.get('detected_pcie_lanes', 'Unknown')]
+        yield ['Expected Min Throughput (MB/s):', compliance.get('expected_min_throughput', 0)]
+        yield []
+        
+        # Validation Results
+        yield ['Validation Results']
+        yield ['Metric', 'Status', 'Actual', 'Expected', 'Description']
+        
+        validations = compliance.get('validations', [])
+        for validation in validations:
+            yield [
+                validation.get('metric', ''),
+                validation.get('status', ''),
+                validation.get('actual', ''),
+                validation.get('expected_min', validation.get('expected_max', '')),
+                validation.get('description', '')
+            ]
+        
+        # Warnings and Errors
+        if results.get('warnings'):
+            yield []
+            yield ['Warnings']
+            for warning in results['warnings']:
+                yield [warning]
+        
+        if results.get('errors'):
+            yield []
+            yield ['Errors']
+            for error in results['errors']:
+                yield [error]
+
     def export_to_html(self, results: Dict[str, Any], output_path: str) -> bool:
         """
         Export test results to HTML format with embedded charts
@@ -740,6 +742,44 @@ class ResultsExporter:
             logger.error(f"Error exporting results: {str(e)}")
             return False
 
+    def iter_rows(self, results: Dict[str, Any], format_type: str) -> Iterator[bytes]:
+        """
+        Render results in the specified format as a stream of encoded chunks
+
+        CSV is produced one row at a time; HTML and PDF are rendered in memory
+        and yielded as a single chunk. Nothing is written to disk.
+
+        Args:
+            results: Test results dictionary
+            format_type: Export format ('csv', 'html', 'pdf')
+
+        Returns:
+            Iterator of UTF-8 encoded bytes
+
+        Raises:
+            ValueError: If the format is unsupported or cannot be rendered
+        """
+        format_type = format_type.lower()
+
+        if format_type == 'csv':
+            buffer = StringIO()
+            writer = csv.writer(buffer)
+            for row in self._csv_rows(results):
+                writer.writerow(row)
+                yield buffer.getvalue().encode('utf-8')
+                buffer.seek(0)
+                buffer.truncate(0)
+        elif format_type == 'html':
+            yield self._generate_html_report(results).encode('utf-8')
+        elif format_type == 'pdf':
+            # SimpleDocTemplate accepts any file-like object in place of a path
+            pdf_buffer = BytesIO()
+            if not self.export_to_pdf(results, pdf_buffer):
+                raise ValueError("PDF export failed")
+            yield pdf_buffer.getvalue()
+        else:
+            raise ValueError(f"Unsupported export format: {format_type}")
+
 
 # Example usage
 if __name__ == "__main__":
@@ -0,0 +1,54 @@
+"""
+Run id uniqueness for stored run-all results
+
+Run with: python -m pytest tests/test_run_results.py
+"""
+
+from datetime import datetime
+
+import pytest
+
+from tests import test_runner as test_runner_module
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() never leaves a single second"""
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2025, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def same_second(monkeypatch):
+    monkeypatch.setattr(test_runner_module, 'datetime', _FrozenDatetime)
+
+
+def test_runs_started_in_the_same_second_get_distinct_ids(same_second):
+    runner = test_runner_module.TestRunner()
+
+    first = runner.begin_run()
+    second = runner.begin_run()
+
+    assert first.start_time == second.start_time
+    assert first.run_id != second.run_id
+    assert first.run_id.startswith('20250101_120000_')
+
+
+def test_stored_runs_from_the_same_second_do_not_overwrite(same_second):
+    app_module = pytest.importorskip('app')
+    runner = test_runner_module.TestRunner()
+
+    first = runner.begin_run()
+    first.results = {'pcie_discovery': {'status': 'pass', 'run': 'first'}}
+    second = runner.begin_run()
+    second.results = {'pcie_discovery': {'status': 'pass', 'run': 'second'}}
+    runner.finish_run(first)
+    runner.finish_run(second)
+
+    app_module._store_run_result(first)
+    app_module._store_run_result(second)
+
+    with app_module._run_results_lock:
+        assert app_module._run_results[first.run_id]['results']['pcie_discovery']['run'] == 'first'
+        assert app_module._run_results[second.run_id]['results']['pcie_discovery']['run'] == 'second'
@@ -7,7 +7,9 @@ Updated with Link Retrain Count test
 
 import logging
 import json
-from typing import Dict, List, Any, Optional
+import time
+import uuid
+from typing import Dict, List, Any, Optional, Iterator, Tuple
 from datetime import datetime
 from dataclasses import dataclass, field
 
@@ -72,6 +74,9 @@ class TestRunner:
     Manages test suites and results
     """
 
+    # fio presence is re-checked at most this often (each check shells out)
+    FIO_CHECK_TTL_SECONDS = 30
+
     def __init__(self):
         self.test_suites = {
             'pcie_discovery': TestSuite(
@@ -171,6 +176,10 @@ class TestRunner:
         self.nvme_devices_detected = False
         self.discovered_nvme_devices = []
 
+        # Cached (is_available, reason) for fio-based suites
+        self._fio_status: Optional[Tuple[bool, str]] = None
+        self._fio_checked_at = 0.0
+
     def update_nvme_detection_status(self, nvme_test_result: Dict[str, Any]):
         """
         Update NVMe device detection status after NVMe discovery test
@@ -212,16 +221,36 @@ class TestRunner:
 
         # Check if fio is required but not available
         if suite.requires_fio:
-            try:
-                from .fio_utilities import FioUtilities
-                fio_utils = FioUtilities()
-                if not fio_utils.has_fio:
-                    return False, "fio not available. Install fio for performance testing."
-            except ImportError:
-                return False, "fio utilities module not available."
+            fio_available, fio_reason = self._check_fio_status()
+            if not fio_available:
+                return False, fio_reason
 
         return True, ""
 
+    def _check_fio_status(self) -> Tuple[bool, str]:
+        """Check fio availability, reusing the result for FIO_CHECK_TTL_SECONDS"""
+        now = time.monotonic()
+        if self._fio_status is not None and now - self._fio_checked_at < self.FIO_CHECK_TTL_SECONDS:
+            return self._fio_status
+
+        try:
+            from .fio_utilities import FioUtilities
+            fio_utils = FioUtilities()
+            if fio_utils.has_fio:
+                status = (True, "")
+            else:
+                status = (False, "fio not available. Install fio for performance testing.")
+        except ImportError:
+            status = (False, "fio utilities module not available.")
+
+        self._fio_status = status
+        self._fio_checked_at = now
+        return status
+
+    def invalidate_capability_cache(self):
+        """Force the next availability check to probe for fio again"""
+        self._fio_status = None
+
     def list_available_tests(self) -> List[Dict[str, Any]]:
         """
         List all available test suites with their requirements
@@ -366,18 +395,42 @@ class TestRunner:
         Returns:
             TestRunResult with all test results
         """
-        run_id = datetime.now().strftime('%Y%m%d_%H%M%S')
+        run_result = self.begin_run(options)
+
+        for _ in self.iter_all_tests(run_result, progress_callback, options):
+            pass
+
+        return self.finish_run(run_result)
+
+    def begin_run(self, options=None) -> TestRunResult:
+        """Create the TestRunResult for a new run of all test suites"""
         start_time = datetime.now()
+        # Runs can start within the same second (REST stream and WebSocket, or two
+        # clients), and the id keys stored results, so it carries a random suffix
+        run_id = f"{start_time.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
 
         logger.info(f"Starting test run {run_id}")
         if options:
             logger.info(f"Test options: {options}")
 
-        run_result = TestRunResult(
+        return TestRunResult(
             run_id=run_id,
             start_time=start_time
         )
 
+    def iter_all_tests(self, run_result: TestRunResult, progress_callback=None,
+                       options=None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Run available test suites in order, yielding each result as it completes
+
+        Args:
+            run_result: TestRunResult from begin_run(); results are recorded into it
+            progress_callback: Optional callback for progress updates
+            options: Optional test options (will be passed to all tests)
+
+        Yields:
+            (suite_id, result) tuples
+        """
         # Run tests in order: PCIe Discovery, NVMe Discovery, then conditional tests
         test_order = ['pcie_discovery', 'nvme_discovery', 'link_training_time', 'link_retrain_count', 'link_quality', 'nvme_namespace_validation', 'nvme_command_set_validation', 'nvme_identify_validation', 'sequential_read_performance', 'sequential_write_performance', 'random_iops_performance']
 
@@ -396,7 +449,10 @@ class TestRunner:
             run_result.results[suite_id] = result
             run_result.suites_run.append(suite_id)
 
-        # Calculate summary
+            yield suite_id, result
+
+    def finish_run(self, run_result: TestRunResult) -> TestRunResult:
+        """Stamp the end time and compute the summary and overall status of a run"""
         run_result.end_time = datetime.now()
         run_result.total_duration_ms = int(
             (run_result.end_time - run_result.start_time).total_seconds() * 1000
@@ -424,7 +480,7 @@ class TestRunner:
         else:
             run_result.overall_status = 'pass'
 
-        logger.info(f"Test run {run_id} completed: {run_result.overall_status}")
+        logger.info(f"Test run {run_result.run_id} completed: {run_result.overall_status}")
 
         return run_result
 